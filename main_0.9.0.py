@@ -34,16 +34,17 @@ Modules:
 - re: Provides regular expression matching operations.
 - datetime: Supplies classes for manipulating dates and times.
 - bs4 (BeautifulSoup): Used for parsing HTML and XML documents.
+- lxml: Parses the 'A View in the Dark' pages and runs the compiled XPath queries used by the scraper.
 - PySide6: Provides a set of Python bindings for the Qt application framework.
 - sqlite3: Interface for SQLite database management.
 - webbrowser: Enables the opening of URLs in the default web browser.
-- math: Provides mathematical functions used in damage calculations.
 - logging: Used for logging debug, information, warning, and error messages.
 
 Classes:
 - RBCCommunityMap: The main application class that initializes and manages the user interface,
   character management, web scraping, shopping list generation, minimap functionalities, and theme customization.
 - DatabaseViewer: A utility class that displays the contents of database tables in a tabbed view.
+- SqlTableModel: A read-only table model that backs the DatabaseViewer tabs with the raw query rows.
 - CharacterDialog: A dialog class for adding or modifying user characters.
 - ThemeCustomizationDialog: A dialog class for customizing the application theme.
 - SetDestinationDialog: A dialog class for setting a destination on the map.
@@ -66,6 +67,7 @@ Functions:
 - extract_coordinates_from_html: Extracts map coordinates from the loaded HTML content.
 - process_html: Updates map-related data such as character coordinates and coins using extracted HTML data.
 - find_nearest_location: Finds the nearest point of interest based on a given set of coordinates.
+- build_location_index: Precomputes the bank, transit and tavern coordinates used by the nearest-location searches.
 - calculate_ap_cost: Calculates the Action Point (AP) cost between two map coordinates.
 - update_guilds: Updates the guilds data in the SQLite database using scraped data.
 - update_shops: Updates the shops data in the SQLite database using scraped data.
@@ -87,70 +89,91 @@ Key Features:
 - Ability to calculate damage dealt to characters and generate shopping lists based on in-game needs.
 
 To install all required modules, run the following command:
- pip install requests bs4 PySide6 PySide6-WebEngine
+ pip install requests bs4 lxml PySide6 PySide6-WebEngine
 """
 
 import importlib.util
-import math
+import json
 import os
 # -----------------------
 # Imports Handling
 # -----------------------
 import sys
 
-# List of required modules
-required_modules = [
-    'pickle', 'pymysql', 'requests', 're', 'time', 'sqlite3',
-    'webbrowser', 'datetime', 'bs4', 'PySide6.QtWidgets',
-    'PySide6.QtGui', 'PySide6.QtCore', 'PySide6.QtWebEngineWidgets',
-    'PySide6.QtWebChannel', 'PySide6.QtNetwork','cryptography', 'hashlib'
-]
+# Required modules, each paired with the pip package that provides it
+REQUIRED_MODULES = (
+    ('pickle', 'pickle'), ('requests', 'requests'), ('re', 're'), ('time', 'time'), ('sqlite3', 'sqlite3'),
+    ('webbrowser', 'webbrowser'), ('datetime', 'datetime'), ('bs4', 'bs4'), ('lxml', 'lxml'),
+    ('PySide6.QtWidgets', 'PySide6'), ('PySide6.QtGui', 'PySide6'), ('PySide6.QtCore', 'PySide6'),
+    ('PySide6.QtWebEngineWidgets', 'PySide6'), ('PySide6.QtWebChannel', 'PySide6'),
+    ('PySide6.QtNetwork', 'PySide6'), ('cryptography', 'cryptography'), ('hashlib', 'hashlib'),
+)
+
+# Standard library modules that ship with every CPython install and cannot be missing or pip-installed
+_BUILTIN_PKGS = frozenset({'pickle', 're', 'time', 'sqlite3', 'webbrowser', 'datetime', 'hashlib'})
 
 def check_required_modules(modules):
     """
     Check if all required modules are installed.
 
     Args:
-        modules (list): List of module names as strings.
+        modules (tuple): (module name, pip package) pairs.
 
     Returns:
         bool: True if all modules are installed, False otherwise.
     """
     missing_modules = []
-    for module in modules:
-        if importlib.util.find_spec(module) is None:
-            missing_modules.append(module)
+    for module, pip_name in modules:
+        if pip_name in _BUILTIN_PKGS:
+            continue
+
+        # find_spec only locates the module without executing it. For a dotted name it imports the parent
+        # package first and raises instead of returning None when that parent is missing.
+        try:
+            spec = importlib.util.find_spec(module)
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None:
+            missing_modules.append((module, pip_name))
 
     if missing_modules:
         print("The following modules are missing:")
-        for mod in missing_modules:
+        for mod, _ in missing_modules:
             print(f"- {mod}")
+        # Several modules come from the same package (e.g. PySide6), so list each package once, sorted
+        install_pkgs = sorted({pip_name for _, pip_name in missing_modules})
         print("\nYou can install them with:")
-        print(f"pip install {' '.join(missing_modules)}")
+        print(f"pip install {' '.join(install_pkgs)}")
         return False
     return True
 
 # Check for required modules
-if not check_required_modules(required_modules):
+if not check_required_modules(REQUIRED_MODULES):
     sys.exit("Missing required modules. Please install them and try again.")
 
 # Proceed with the rest of the imports and program setup
 import logging
-import pymysql
+import logging.handlers
 import requests
 import re
+import threading
 import webbrowser
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QComboBox, QLabel, QFrame, QSizePolicy, QLineEdit, QDialog, QFormLayout, QListWidget, QListWidgetItem,
-    QMessageBox, QFileDialog, QColorDialog, QTabWidget, QScrollArea, QTableWidget, QTableWidgetItem, QInputDialog,
+    QMessageBox, QFileDialog, QColorDialog, QTabWidget, QScrollArea, QTableView, QInputDialog,
     QTextEdit
 )
 from PySide6.QtGui import QPixmap, QPainter, QColor, QFontMetrics, QPen, QIcon, QAction, QIntValidator, QMouseEvent
-from PySide6.QtCore import QUrl, Qt, QRect, QEasingCurve, QPropertyAnimation, QSize, QTimer, QDateTime
-from PySide6.QtCore import Slot as pyqtSlot
+from PySide6.QtCore import (
+    QUrl, Qt, QRect, QSize, QTimer, QDateTime, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    QStringListModel
+)
+from PySide6.QtCore import Slot as pyqtSlot, Signal as pyqtSignal
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile
@@ -182,9 +205,14 @@ def ensure_directories_exist():
     If any of these directories do not exist, they are created in the current working directory.
     """
     required_dirs = ['logs', 'sessions', 'images']
+
+    # One directory listing classifies every required entry instead of a stat() call per directory
+    with os.scandir('.') as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+
     for directory in required_dirs:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory not in existing:
+            os.makedirs(directory, exist_ok=True)
             print(f"Created directory: {directory}")
 
 # Call the function to ensure directories are present
@@ -199,11 +227,11 @@ def setup_logging():
     Set up logging configuration to save logs in the 'logs' directory.
 
     This function configures the logging system to record application events,
-    errors, and debug information in a log file. The log file is named
-    'rbc_{date}.log', where {date} is replaced with the current date in the
-    format 'YYYY-MM-DD'. The log files are saved in the 'logs' directory,
-    and log messages are formatted to include the timestamp, log level,
-    and the message content.
+    errors, and debug information in a log file. The current log is written to
+    'rbc.log' and rotated at midnight, when the finished day's log is renamed to
+    'rbc.log.{date}' with the date in the format 'YYYY-MM-DD'. The log files are
+    saved in the 'logs' directory, and log messages are formatted to include the
+    timestamp, log level, and the message content.
 
     Logging levels used:
     - DEBUG: Detailed information, typically of interest only when diagnosing problems.
@@ -214,12 +242,15 @@ def setup_logging():
     If the 'logs' directory does not exist, it should be created by calling
     the 'ensure_directories_exist()' function before this function.
     """
-    log_filename = datetime.now().strftime('./logs/rbc_%Y-%m-%d.log')
+    log_filename = os.path.join('.', 'logs', 'rbc.log')
+
+    # The handler starts a new file at midnight, so a session running past midnight keeps logging to the
+    # correct day's file. The rotated logs are all kept, as before.
+    handler = logging.handlers.TimedRotatingFileHandler(log_filename, when='midnight', encoding='utf-8')
     logging.basicConfig(
         level=logging.DEBUG,  # Set the logging level to DEBUG to capture all events
         format='%(asctime)s - %(levelname)s - %(message)s',  # Define the log message format
-        filename=log_filename,  # Log file path and name
-        filemode='a'  # Append to the log file if it already exists
+        handlers=[handler]  # Append to the current log file, rotating it daily
     )
     print(f"Logging to: {log_filename}")  # Print the log file location to the console
 
@@ -233,6 +264,91 @@ setup_logging()
 # Local Database path
 DB_PATH = 'sessions/rbc_map_data.db'
 
+# Statements run on every zoom and destination change. Keeping each SQL text in a single constant lets
+# sqlite3's per-connection statement cache hand back the compiled statement instead of re-preparing it.
+_SQL_GET_DESTINATION = "SELECT col, row FROM destinations ORDER BY timestamp DESC LIMIT 1"
+_SQL_SET_DESTINATION = """
+    INSERT INTO destinations (character_id, col, row, timestamp) VALUES (?, ?, ?, datetime('now'))
+    ON CONFLICT(character_id) DO UPDATE SET col = excluded.col, row = excluded.row, timestamp = excluded.timestamp
+"""
+_SQL_CHARACTER_ID_BY_NAME = "SELECT id FROM characters WHERE name = ?"
+_SQL_LOAD_SETTING = "SELECT setting_value FROM settings WHERE setting_name = ?"
+_SQL_SAVE_SETTING = """
+    INSERT INTO settings (setting_name, setting_value) VALUES (?, ?)
+    ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
+"""
+# Default theme colors, keyed by color mapping name; each is stored in settings as "theme_<name>"
+_THEME_DEFAULTS = {
+    "background": "#d4d4d4",
+    "text_color": "#000000",
+    "button_color": "#b1b1b1",
+    "bank": "blue",
+    "tavern": "orange",
+    "transit": "red",
+    "user_building": "purple",
+    "shop": "green",
+    "guild": "yellow",
+    "placesofinterest": "purple",
+}
+_THEME_SETTING_NAMES = tuple(f"theme_{key}" for key in _THEME_DEFAULTS)
+_SQL_LOAD_THEME_SETTINGS = (
+    f"SELECT setting_name, setting_value FROM settings "
+    f"WHERE setting_name IN ({', '.join('?' * len(_THEME_SETTING_NAMES))})"
+)
+_SQL_INSERT_RECENT_DESTINATION = "INSERT INTO recent_destinations (character_id, col, row) VALUES (?, ?, ?)"
+# Keep a character's ten newest rows. timestamp has one-second resolution, so id breaks ties between rows
+# saved in the same second; the subquery is served by the idx_recent_char_ts index.
+_SQL_PRUNE_RECENT_DESTINATIONS = """
+    DELETE FROM recent_destinations
+    WHERE character_id = ? AND id NOT IN (
+        SELECT id FROM recent_destinations WHERE character_id = ? ORDER BY timestamp DESC, id DESC LIMIT 10
+    )
+"""
+
+# Tuning applied to every connection the application opens. WAL with synchronous=NORMAL avoids an fsync
+# per commit, and mmap lets hot pages be read without going through read() on each lookup.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+def _connect(path=DB_PATH):
+    """
+    Open a SQLite connection with the application's PRAGMA tuning applied.
+
+    Args:
+        path (str): Path to the SQLite database. Defaults to DB_PATH.
+
+    Returns:
+        sqlite3.Connection: The configured connection.
+    """
+    # Room for every distinct statement the application issues, so none is evicted and re-prepared
+    connection = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+    connection.executescript(_CONNECTION_PRAGMAS)
+    return connection
+
+# Long-lived connection shared by the module-level helpers, opened on first use. The lock serializes access,
+# since the connection is created with check_same_thread=False.
+_SHARED_CONNECTION = None
+_SHARED_CONNECTION_LOCK = threading.Lock()
+
+def _get_conn():
+    """
+    Return the module's shared SQLite connection, opening it on first use.
+
+    Callers must hold _SHARED_CONNECTION_LOCK while using the connection.
+
+    Returns:
+        sqlite3.Connection: The shared, tuned connection to DB_PATH.
+    """
+    global _SHARED_CONNECTION
+    if _SHARED_CONNECTION is None:
+        _SHARED_CONNECTION = _connect()
+    return _SHARED_CONNECTION
+
 def initialize_database(DB_PATH):
     """Initialize the SQLite database with the required schema and data."""
     connection = sqlite3.connect(DB_PATH)
@@ -1365,9 +1481,35 @@ INSERT OR IGNORE INTO  "userbuildings" ("ID","Name","Column","Row") VALUES (1,'A
  (141,'Wyndcryer''s TygerNight''s and Bambi''s Lair','Unicorn','77th'),
  (142,'Wyvernhall','Ivy','38th'),
  (143,'X','Emerald','NCL');
+CREATE INDEX IF NOT EXISTS idx_recent_char_ts ON recent_destinations(character_id, timestamp DESC);
 COMMIT;
 """)
 
+    # One-time migration: the destination upsert needs one row per character. Databases created before the
+    # unique index existed may hold duplicates, so keep each character's most recently set row (newest timestamp,
+    # as _SQL_GET_DESTINATION reads it; the old code updated rows in place, so the highest id is not always newest)
+    # and add the index together.
+    index_exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_destinations_character'"
+    ).fetchone()
+    if not index_exists:
+        with connection:
+            cursor.execute("""
+                DELETE FROM destinations WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY character_id ORDER BY timestamp DESC, id DESC
+                        ) AS position
+                        FROM destinations
+                    ) WHERE position > 1
+                )
+            """)
+            cursor.execute("CREATE UNIQUE INDEX idx_destinations_character ON destinations(character_id)")
+
+    # Switch the file to WAL once at startup; journal_mode=WAL is persistent, so the database is already in
+    # WAL mode by the time the first _connect() connection opens it
+    connection.execute("PRAGMA journal_mode=WAL")
+
     # Commit changes and close connection
     connection.commit()
     connection.close()
@@ -1379,6 +1521,24 @@ initialize_database(DB_PATH)
 # Load Data from Database
 # -----------------------
 
+# Tables read by load_data, fetched together by _SQL_LOAD_MAP_DATA and told apart by the first column
+_MAP_DATA_TABLES = (
+    'columns', 'rows', 'banks', 'taverns', 'transits', 'userbuildings', 'color_mappings', 'shops', 'guilds',
+    'placesofinterest'
+)
+_SQL_LOAD_MAP_DATA = """
+    SELECT 'columns', `Name`, `Coordinate`, NULL FROM `columns`
+    UNION ALL SELECT 'rows', `Name`, `Coordinate`, NULL FROM `rows`
+    UNION ALL SELECT 'banks', NULL, `Column`, `Row` FROM banks
+    UNION ALL SELECT 'taverns', `Name`, `Column`, `Row` FROM taverns
+    UNION ALL SELECT 'transits', `Name`, `Column`, `Row` FROM transits
+    UNION ALL SELECT 'userbuildings', `Name`, `Column`, `Row` FROM userbuildings
+    UNION ALL SELECT 'color_mappings', `Type`, `Color`, NULL FROM color_mappings
+    UNION ALL SELECT 'shops', `Name`, `Column`, `Row` FROM shops
+    UNION ALL SELECT 'guilds', `Name`, `Column`, `Row` FROM guilds
+    UNION ALL SELECT 'placesofinterest', `Name`, `Column`, `Row` FROM placesofinterest
+"""
+
 def load_data(DB_PATH):
     """
     Load various map-related data from the SQLite database.
@@ -1394,7 +1554,8 @@ def load_data(DB_PATH):
         tuple: Contains the following data:
             - columns (dict): Mapping of column names to their coordinates.
             - rows (dict): Mapping of row names to their coordinates.
-            - banks_coordinates (list): List of tuples containing column and row coordinates for banks.
+            - banks_coordinates (list): List of (column name, row name, column coordinate, row coordinate)
+              tuples for banks. The coordinates are None when a street name cannot be resolved.
             - taverns_coordinates (dict): Mapping of tavern names to their coordinates.
             - transits_coordinates (dict): Mapping of transit names to their coordinates.
             - user_buildings_coordinates (dict): Mapping of user building names to their coordinates.
@@ -1403,85 +1564,41 @@ def load_data(DB_PATH):
             - guilds_coordinates (dict): Mapping of guild names to their coordinates.
             - places_of_interest_coordinates (dict): Mapping of place of interest names to their coordinates.
     """
-    connection = sqlite3.connect(DB_PATH)
+    connection = _connect(DB_PATH)
     cursor = connection.cursor()
 
-    # Fetch column names and their coordinates
-    cursor.execute("SELECT `Name`, `Coordinate` FROM `columns`")
-    columns_data = cursor.fetchall()
-    columns = {name: int(coordinate) for name, coordinate in columns_data}
+    # Fetch every table in one round trip and group the rows by their source table
+    data = {table: [] for table in _MAP_DATA_TABLES}
+    for table, name, col, row in cursor.execute(_SQL_LOAD_MAP_DATA):
+        data[table].append((name, col, row))
 
-    # Fetch row names and their coordinates
-    cursor.execute("SELECT `Name`, `Coordinate` FROM `rows`")
-    rows_data = cursor.fetchall()
-    rows = {name: int(coordinate) for name, coordinate in rows_data}
+    # Column and row names with their coordinates
+    columns = {name: int(coordinate) for name, coordinate, _ in data['columns']}
+    rows = {name: int(coordinate) for name, coordinate, _ in data['rows']}
 
-    # Fetch coordinates from the banks table
-    cursor.execute("SELECT `Column`, `Row` FROM banks")
-    banks_data = cursor.fetchall()
+    # Banks, resolving the intersection once here
     banks_coordinates = [
-        (col, row, None, None)
-        for col, row in banks_data
+        (col, row, columns.get(col), rows.get(row))
+        for _, col, row in data['banks']
     ]
 
-    # Fetch taverns and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM taverns")
-    taverns_data = cursor.fetchall()
-    taverns_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in taverns_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
-
-    # Fetch transits and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM transits")
-    transits_data = cursor.fetchall()
-    transits_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in transits_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
-
-    # Fetch user buildings and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM userbuildings")
-    user_buildings_data = cursor.fetchall()
-    user_buildings_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in user_buildings_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
+    def resolve(entries):
+        """Map each named building to the cell SE of its intersection, skipping unknown street names."""
+        return {
+            name: (columns.get(col) + 1, rows.get(row) + 1)
+            for name, col, row in entries
+            if columns.get(col) is not None and rows.get(row) is not None
+        }
 
-    # Fetch color mappings
-    cursor.execute("SELECT `Type`, `Color` FROM color_mappings")
-    color_mappings_data = cursor.fetchall()
-    color_mappings = {type_: QColor(color) for type_, color in color_mappings_data}
-
-    # Fetch shops and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM shops")
-    shops_data = cursor.fetchall()
-    shops_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in shops_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
+    taverns_coordinates = resolve(data['taverns'])
+    transits_coordinates = resolve(data['transits'])
+    user_buildings_coordinates = resolve(data['userbuildings'])
+    shops_coordinates = resolve(data['shops'])
+    guilds_coordinates = resolve(data['guilds'])
+    places_of_interest_coordinates = resolve(data['placesofinterest'])
 
-    # Fetch guilds and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM guilds")
-    guilds_data = cursor.fetchall()
-    guilds_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in guilds_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
-
-    # Fetch places of interest and their coordinates
-    cursor.execute("SELECT `Name`, `Column`, `Row` FROM placesofinterest")
-    places_of_interest_data = cursor.fetchall()
-    places_of_interest_coordinates = {
-        name: (columns.get(col) + 1, rows.get(row) + 1)
-        for name, col, row in places_of_interest_data
-        if columns.get(col) is not None and rows.get(row) is not None
-    }
+    # Color mappings (type in the name slot, color in the column slot)
+    color_mappings = {type_: QColor(color) for type_, color, _ in data['color_mappings']}
 
     # Close the database connection after fetching all data
     connection.close()
@@ -1506,6 +1623,14 @@ columns, rows, banks_coordinates, taverns_coordinates, transits_coordinates, use
 # Webview Cookie Database
 # -----------------------
 
+# Cookie statements kept as constants so every call hits the shared connection's statement cache
+_SQL_SAVE_COOKIE = """
+    INSERT INTO cookies (name, value, domain, path, expiry, secure, httponly)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_LOAD_COOKIES = "SELECT name, value, domain, path, expiry, secure, httponly FROM cookies"
+_SQL_CLEAR_COOKIES = "DELETE FROM cookies"
+
 def save_cookie_to_db(cookie):
     """
     Save a single cookie to the SQLite database.
@@ -1515,22 +1640,18 @@ def save_cookie_to_db(cookie):
 
     This function inserts the cookie's details into the 'cookies' table in the SQLite database.
     """
-    connection = sqlite3.connect(DB_PATH)
-    cursor = connection.cursor()
-    cursor.execute('''
-        INSERT INTO cookies (name, value, domain, path, expiry, secure, httponly)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        cookie.name().data().decode('utf-8'),
-        cookie.value().data().decode('utf-8'),
-        cookie.domain(),
-        cookie.path(),
-        cookie.expirationDate().toString() if not cookie.isSessionCookie() else None,
-        int(cookie.isSecure()),
-        int(cookie.isHttpOnly())
-    ))
-    connection.commit()
-    connection.close()
+    with _SHARED_CONNECTION_LOCK:
+        connection = _get_conn()
+        connection.execute(_SQL_SAVE_COOKIE, (
+            cookie.name().data().decode('utf-8'),
+            cookie.value().data().decode('utf-8'),
+            cookie.domain(),
+            cookie.path(),
+            cookie.expirationDate().toString() if not cookie.isSessionCookie() else None,
+            int(cookie.isSecure()),
+            int(cookie.isHttpOnly())
+        ))
+        connection.commit()
 
 def load_cookies_from_db():
     """
@@ -1542,10 +1663,8 @@ def load_cookies_from_db():
     This function retrieves all cookies from the 'cookies' table in the SQLite database
     and converts them into QNetworkCookie objects.
     """
-    connection = sqlite3.connect(DB_PATH)
-    cursor = connection.cursor()
-    cursor.execute('SELECT name, value, domain, path, expiry, secure, httponly FROM cookies')
-    rows = cursor.fetchall()
+    with _SHARED_CONNECTION_LOCK:
+        rows = _get_conn().execute(_SQL_LOAD_COOKIES).fetchall()
     cookies = []
     for row in rows:
         cookie = QNetworkCookie(
@@ -1560,7 +1679,6 @@ def load_cookies_from_db():
         cookie.setSecure(bool(row[5]))
         cookie.setHttpOnly(bool(row[6]))
         cookies.append(cookie)
-    connection.close()
     return cookies
 
 def clear_cookie_db():
@@ -1569,11 +1687,54 @@ def clear_cookie_db():
 
     This function deletes all records from the 'cookies' table, effectively clearing all stored cookies.
     """
-    connection = sqlite3.connect(DB_PATH)
-    cursor = connection.cursor()
-    cursor.execute('DELETE FROM cookies')
-    connection.commit()
-    connection.close()
+    with _SHARED_CONNECTION_LOCK:
+        connection = _get_conn()
+        connection.execute(_SQL_CLEAR_COOKIES)
+        connection.commit()
+
+# -----------------------
+# Minimap Zoom Parameters
+# -----------------------
+
+# Per-zoom-level geometry used when recentering and navigating the minimap.
+# recenter_offset: shift applied to the character position by recenter_minimap
+# center: offset of the center cell from column_start/row_start
+# min_start/max_start: clamping range for column_start/row_start when clicking on the minimap
+ZOOM_PARAMS = {
+    zoom: {
+        'recenter_offset': (zoom - 4) // 2,
+        'center': zoom // 2,
+        'min_start': -(zoom // 2),
+        'max_start': 201 + (zoom // 2) - zoom,
+    }
+    for zoom in (3, 5, 7)
+}
+
+# -----------------------
+# Game Page Parsing Patterns
+# -----------------------
+
+# The coordinate lookup only reads <input> fields and the current location <td>, so only those are parsed
+_COORDINATE_STRAINER = SoupStrainer(['input', 'td'])
+
+# Coin messages searched for on every page load, compiled once at import
+_BANK_BALANCE_RE = re.compile(r"Welcome to Omnibank. Your account has (\d+) coins in it.")
+_POCKET_BALANCE_RE = re.compile(r"You have (\d+) coins")
+_DEPOSIT_RE = re.compile(r"You deposit (\d+) coins.")
+_WITHDRAW_RE = re.compile(r"You withdraw (\d+) coins.")
+_TRANSIT_COINS_RE = re.compile(r"It costs 5 coins to ride. You have (\d+).")
+
+# Other coin-related actions (e.g., hunting, robbing, etc.), checked in order; the first match wins
+_COIN_ACTION_PATTERNS = (
+    ('hunter', re.compile(r"You drink the hunter's blood.*You also found (?P<coins>\d+) coins")),
+    ('paladin', re.compile(r"You drink the paladin's blood.*You also found (?P<coins>\d+) coins")),
+    ('human', re.compile(r"You drink the human's blood.*You also found (?P<coins>\d+) coins")),
+    ('bag_of_coins', re.compile(r'The bag contained (?P<coins>\d+) coins')),
+    ('robbing', re.compile(r'You stole (?P<coins>\d+) coins from (?P<name>\w+)')),
+    ('silver_suitcase', re.compile(r'The suitcase contained (?P<coins>\d+) coins')),
+    ('given_coins', re.compile(r'(?P<name>\w+) gave you (?P<coins>\d+) coins')),
+    ('getting_robbed', re.compile(r'(?P<name>\w+) stole (?P<coins>\d+) coins from you')),
+)
 
 # -----------------------
 # RBC Community Map Main Class
@@ -1589,11 +1750,15 @@ class RBCCommunityMap(QMainWindow):
         """
         super().__init__()
 
+        # Long-lived connection reused by the minimap, zoom and destination handlers
+        self._db = _connect()
+
         self.is_updating_minimap = False
 
         # Early initialization of the scraper
         self.AVITD_scraper = AVITDScraper()
-        self.AVITD_scraper.scrape_guilds_and_shops()
+        self._scrape_task = None
+        self._scrape_running = False  # Set while a ScrapeTask is downloading; see start_background_scrape
 
         self.login_needed = True
 
@@ -1620,6 +1785,7 @@ class RBCCommunityMap(QMainWindow):
 
         # Load the data
         self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates, self.transits_coordinates, self.user_buildings_coordinates, self.color_mappings, self.shops_coordinates, self.guilds_coordinates, self.places_of_interest_coordinates = load_data(DB_PATH)
+        self.build_location_index()
 
         # Set up the UI components
         self.zoom_level = 3
@@ -1628,6 +1794,7 @@ class RBCCommunityMap(QMainWindow):
         self.column_start = 0
         self.row_start = 0
         self.destination = None
+        self._labels_state = None  # "dest" or "no_dest" once the destination labels have been filled
         self.color_mappings = color_mappings
 
         # Initialize characters list and character_list widget early to avoid attribute errors
@@ -1649,6 +1816,61 @@ class RBCCommunityMap(QMainWindow):
         self.update_minimap()
         self.load_last_active_character()
 
+        # Refresh guild and shop locations in the background; the map is redrawn from the stored
+        # data now and again once the scrape has been saved
+        self.start_background_scrape()
+
+    # -----------------------
+    # Background Guild and Shop Scraping
+    # -----------------------
+
+    def start_background_scrape(self):
+        """
+        Submit a ScrapeTask to the global thread pool to refresh the guild and shop locations.
+
+        Only one scrape runs at a time, as the tasks share the scraper's HTTP session; while a scrape is
+        still running no new task is started and the running one is returned instead.
+
+        Returns:
+            ScrapeTask: The task doing the scrape, whose signals.finished fires once the results are in.
+        """
+        if self._scrape_running:
+            logging.info("Guild and shop scrape already running; not starting another.")
+            return self._scrape_task
+
+        self._scrape_task = ScrapeTask(self.AVITD_scraper)
+        self._scrape_task.setAutoDelete(False)  # Kept alive by self._scrape_task until the next scrape
+        self._scrape_task.signals.finished.connect(self.on_scrape_finished)
+        self._scrape_running = True
+        QThreadPool.globalInstance().start(self._scrape_task)
+        return self._scrape_task
+
+    def on_scrape_finished(self, results):
+        """
+        Store the scraped guild and shop data and redraw the map with it. Runs on the GUI thread.
+
+        Args:
+            results (tuple): The tuple returned by AVITDScraper.fetch_guilds_and_shops, or None if the scrape failed.
+        """
+        self._scrape_running = False
+        if results is not None:
+            try:
+                self.AVITD_scraper.store_results(results)
+            except sqlite3.Error as e:
+                # store_results has already rolled back; keep showing the locations currently in the database
+                logging.error(f"Failed to store scraped guilds and shops: {e}")
+        self.reload_location_data()
+        self.update_minimap()
+
+    def reload_location_data(self):
+        """
+        Reload the map locations from the database and rebuild the lookup indexes, leaving the theme colors alone.
+        """
+        (self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates, self.transits_coordinates,
+         self.user_buildings_coordinates, _, self.shops_coordinates, self.guilds_coordinates,
+         self.places_of_interest_coordinates) = load_data(DB_PATH)
+        self.build_location_index()
+
     # -----------------------
     # Load and apply customized UI Theme
     # -----------------------
@@ -1659,33 +1881,17 @@ class RBCCommunityMap(QMainWindow):
         Each theme setting is stored individually under the `settings` table.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
-            # Query all theme-related settings
-            cursor.execute("SELECT setting_name, setting_value FROM settings WHERE setting_name LIKE 'theme_%'")
-            settings = cursor.fetchall()
+            # Query only the theme settings that are used, as primary key lookups rather than a LIKE scan
+            settings = cursor.execute(_SQL_LOAD_THEME_SETTINGS, _THEME_SETTING_NAMES).fetchall()
 
             # Populate color mappings, setting defaults for missing items
-            defaults = {
-                "theme_background": "#d4d4d4",
-                "theme_text_color": "#000000",
-                "theme_button_color": "#b1b1b1",
-                "theme_bank": "blue",
-                "theme_tavern": "orange",
-                "theme_transit": "red",
-                "theme_user_building": "purple",
-                "theme_shop": "green",
-                "theme_guild": "yellow",
-                "theme_placesofinterest": "purple",
-            }
-
             self.color_mappings = {key.replace("theme_", ""): QColor(value) for key, value in settings}
-
-            # Add missing default values
-            for key, default in defaults.items():
-                if key.replace("theme_", "") not in self.color_mappings:
-                    self.color_mappings[key.replace("theme_", "")] = QColor(default)
+            for key, default in _THEME_DEFAULTS.items():
+                if key not in self.color_mappings:
+                    self.color_mappings[key] = QColor(default)
 
             logging.info("Theme settings loaded successfully.")
 
@@ -1693,19 +1899,23 @@ class RBCCommunityMap(QMainWindow):
             logging.error(f"Error loading theme settings: {e}")
             # Apply default theme if the database fails
             self.color_mappings = {
-                "background": QColor("#d4d4d4"),
-                "text_color": QColor("#000000"),
-                "button_color": QColor("#b1b1b1"),
+                key: QColor(_THEME_DEFAULTS[key]) for key in ("background", "text_color", "button_color")
             }
-        finally:
-            connection.close()
 
-    def save_theme_settings(self):
+    def save_theme_settings(self, elements=None):
         """
-        Save each theme setting individually to the `settings` table in SQLite.
+        Save the theme settings to the `settings` table in SQLite in a single transaction.
+
+        Args:
+            elements (iterable, optional): The color mapping keys to write. Defaults to all of them.
         """
+        keys = self.color_mappings.keys() if elements is None else elements
+        rows = [(f"theme_{key}", self.color_mappings[key].name()) for key in keys]  # QColor to hex string
+        if not rows:
+            return
+
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             # Ensure the settings table exists
@@ -1716,21 +1926,15 @@ class RBCCommunityMap(QMainWindow):
                 )
             ''')
 
-            # Save each color mapping individually
-            for key, color in self.color_mappings.items():
-                cursor.execute('''
-                    INSERT INTO settings (setting_name, setting_value)
-                    VALUES (?, ?)
-                    ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
-                ''', (f"theme_{key}", color.name()))  # QColor to hex string
+            # Write all changed colors with one prepared statement and one commit
+            cursor.executemany(_SQL_SAVE_SETTING, rows)
 
             connection.commit()
             logging.info("Theme settings saved successfully.")
 
         except sqlite3.Error as e:
             logging.error(f"Error saving theme settings: {e}")
-        finally:
-            connection.close()
+            connection.rollback()
 
     def apply_theme(self):
         """
@@ -1743,21 +1947,7 @@ class RBCCommunityMap(QMainWindow):
             button_color = self.color_mappings.get("button_color", QColor("#b1b1b1")).name()
 
             # Apply styles
-            self.setStyleSheet(
-                f"""
-                QWidget {{
-                    background-color: {background_color};
-                    color: {text_color};
-                }}
-                QPushButton {{
-                    background-color: {button_color};
-                    color: {text_color};
-                }}
-                QLabel {{
-                    color: {text_color};
-                }}
-                """
-            )
+            self.setStyleSheet(_theme_stylesheet(background_color, text_color, button_color))
             logging.info("Theme applied successfully.")
         except Exception as e:
             logging.error(f"Error applying theme: {e}")
@@ -1772,8 +1962,9 @@ class RBCCommunityMap(QMainWindow):
         if dialog.exec():
             # Update local color mappings and persist changes
             self.color_mappings = dialog.color_mappings
+            self._last_paint_state = None  # Repaint the minimap with the new colors on the next update
             self.apply_theme()
-            self.save_theme_settings()
+            self.save_theme_settings(dialog.changed_elements)
             logging.info("Theme updated and saved.")
 
     # -----------------------
@@ -1797,11 +1988,10 @@ class RBCCommunityMap(QMainWindow):
         """
         Load cookies from the 'cookies' table in rbc_map_data.db and inject them into the QWebEngineProfile.
         """
-        connection = sqlite3.connect(DB_PATH)
+        connection = self._db
         cursor = connection.cursor()
 
-        cursor.execute("SELECT name, domain, path, value, expiration FROM cookies")
-        cookies = cursor.fetchall()
+        cookies = cursor.execute("SELECT name, domain, path, value, expiration FROM cookies").fetchall()
 
         for name, domain, path, value, expiration in cookies:
             cookie = QNetworkCookie()
@@ -1812,7 +2002,6 @@ class RBCCommunityMap(QMainWindow):
             cookie.setExpirationDate(QDateTime.fromSecsSinceEpoch(expiration))
             self.cookie_store.setCookie(cookie, QUrl(f"https://{domain}"))
 
-        connection.close()
         logging.info("Cookies loaded from rbc_map_data.db.")
 
     def on_cookie_added(self, cookie):
@@ -1820,7 +2009,7 @@ class RBCCommunityMap(QMainWindow):
         Save a newly added cookie to the 'cookies' table in rbc_map_data.db.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             # Convert expiration date to a timestamp if it’s not a session cookie
@@ -1841,8 +2030,7 @@ class RBCCommunityMap(QMainWindow):
             logging.debug(f"Cookie added to rbc_map_data.db: {cookie.name().data().decode('utf-8')}")
         except Exception as e:
             logging.error(f"Failed to add cookie to database: {e}")
-        finally:
-            connection.close()
+            connection.rollback()
 
     # -----------------------
     # UI Setup
@@ -2095,11 +2283,10 @@ class RBCCommunityMap(QMainWindow):
 
         # Directly process coins from HTML within `process_html`
         if self.selected_character:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
             try:
-                cursor.execute("SELECT id FROM characters WHERE name = ?", (self.selected_character['name'],))
-                character_row = cursor.fetchone()
+                character_row = cursor.execute(_SQL_CHARACTER_ID_BY_NAME, (self.selected_character['name'],)).fetchone()
                 if character_row:
                     character_id = character_row[0]
                     self.selected_character['id'] = character_id  # Ensure character ID is available for coin extraction
@@ -2109,8 +2296,6 @@ class RBCCommunityMap(QMainWindow):
             except sqlite3.Error as e:
                 logging.error(f"Failed to retrieve character ID: {e}")
             finally:
-                connection.close()
-
                 self.show()
                 self.update_minimap()
 
@@ -2316,7 +2501,7 @@ class RBCCommunityMap(QMainWindow):
         Opens the Damage Calculator dialog within RBCCommunityMap.
         """
         # Initialize the DamageCalculator dialog with the SQLite database connection
-        connection = sqlite3.connect(DB_PATH)
+        connection = self._db
         damage_calculator = DamageCalculator(connection)
 
         # Set the default selection in the combobox to 'No Charisma'
@@ -2325,9 +2510,6 @@ class RBCCommunityMap(QMainWindow):
         # Show the DamageCalculator dialog as a modal
         damage_calculator.exec()
 
-        # Close the database connection after use
-        connection.close()
-
     def display_shopping_list(self, shopping_list):
         """
         Display the shopping list in a dialog.
@@ -2360,7 +2542,7 @@ class RBCCommunityMap(QMainWindow):
         Load characters from the SQLite database, including IDs for reference.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             # Ensure the characters table exists
@@ -2373,17 +2555,15 @@ class RBCCommunityMap(QMainWindow):
             ''')
 
             # Fetch characters from the database including id
-            cursor.execute("SELECT id, name, password FROM characters")
-            character_data = cursor.fetchall()
+            character_data = cursor.execute("SELECT id, name, password FROM characters").fetchall()
             self.characters = [
                 {'id': char_id, 'name': name, 'password': password}
                 for char_id, name, password in character_data
             ]
 
-            # Populate characters list and UI element
+            # Populate characters list and UI element in one batch insert
             self.character_list.clear()
-            for character in self.characters:
-                self.character_list.addItem(QListWidgetItem(character['name']))
+            self.character_list.addItems([character['name'] for character in self.characters])
             logging.debug("Characters loaded successfully from the database.")
 
             # Automatically select the first character if any exist
@@ -2402,15 +2582,13 @@ class RBCCommunityMap(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load characters: {e}")
             self.characters = []
             self.selected_character = None
-        finally:
-            connection.close()
 
     def save_characters(self):
         """
         Save characters to the SQLite database in plaintext.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             # Ensure the characters table exists
@@ -2432,8 +2610,7 @@ class RBCCommunityMap(QMainWindow):
 
         except sqlite3.Error as e:
             logging.error(f"Failed to save characters to database: {e}")
-        finally:
-            connection.close()
+            connection.rollback()
 
     def on_character_selected(self, item):
         """
@@ -2454,11 +2631,10 @@ class RBCCommunityMap(QMainWindow):
 
             # Fetch character ID if missing
             if 'id' not in self.selected_character:
-                connection = sqlite3.connect(DB_PATH)
+                connection = self._db
                 cursor = connection.cursor()
                 try:
-                    cursor.execute("SELECT id FROM characters WHERE name = ?", (character_name,))
-                    character_row = cursor.fetchone()
+                    character_row = cursor.execute(_SQL_CHARACTER_ID_BY_NAME, (character_name,)).fetchone()
                     if character_row:
                         self.selected_character['id'] = character_row[0]
                         logging.debug(f"Character '{character_name}' ID set to {self.selected_character['id']}.")
@@ -2466,8 +2642,6 @@ class RBCCommunityMap(QMainWindow):
                         logging.error(f"Character '{character_name}' not found in characters table.")
                 except sqlite3.Error as e:
                     logging.error(f"Failed to retrieve character_id for '{character_name}': {e}")
-                finally:
-                    connection.close()
 
             # Save last active character
             if 'id' in self.selected_character:
@@ -2522,7 +2696,7 @@ class RBCCommunityMap(QMainWindow):
             name = dialog.name_edit.text()
             password = dialog.password_edit.text()
 
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             try:
@@ -2552,8 +2726,7 @@ class RBCCommunityMap(QMainWindow):
 
             except sqlite3.Error as e:
                 logging.error(f"Failed to create character '{name}': {e}")
-            finally:
-                connection.close()
+                connection.rollback()
 
         else:
             sys.exit("No characters added. Exiting the application.")
@@ -2570,7 +2743,7 @@ class RBCCommunityMap(QMainWindow):
             name = dialog.name_edit.text()
             password = dialog.password_edit.text()
 
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             try:
@@ -2600,8 +2773,7 @@ class RBCCommunityMap(QMainWindow):
 
             except sqlite3.Error as e:
                 logging.error(f"Failed to add character '{name}': {e}")
-            finally:
-                connection.close()
+                connection.rollback()
 
     def modify_character(self):
         """
@@ -2644,7 +2816,7 @@ class RBCCommunityMap(QMainWindow):
         Save the last active character's ID to the last_active_character table.
         Ensures that only one entry exists, replacing any previous entry.
         """
-        connection = sqlite3.connect(DB_PATH)
+        connection = self._db
         cursor = connection.cursor()
 
         try:
@@ -2658,20 +2830,18 @@ class RBCCommunityMap(QMainWindow):
 
         except sqlite3.Error as e:
             logging.error(f"Failed to save last active character: {e}")
-        finally:
-            connection.close()
+            connection.rollback()
 
     def load_last_active_character(self):
         """
         Load the last active character from the database by character_id and set the selected character for auto-login.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._db
             cursor = connection.cursor()
 
             # Retrieve the last active character's ID from the last_active_character table
-            cursor.execute("SELECT character_id FROM last_active_character")
-            result = cursor.fetchone()
+            result = cursor.execute("SELECT character_id FROM last_active_character").fetchone()
 
             if result:
                 character_id = result[0]
@@ -2692,8 +2862,6 @@ class RBCCommunityMap(QMainWindow):
 
         except sqlite3.Error as e:
             logging.error(f"Failed to load last active character from database: {e}")
-        finally:
-            connection.close()
 
     # -----------------------
     # Web View Handling
@@ -2764,7 +2932,7 @@ class RBCCommunityMap(QMainWindow):
         Parses the HTML using BeautifulSoup to find the input elements that hold the
         x and y coordinates. Returns these coordinates if found, otherwise returns None.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', parse_only=_COORDINATE_STRAINER)
         x_input = soup.find('input', {'name': 'x'})
         y_input = soup.find('input', {'name': 'y'})
         if x_input and y_input:
@@ -2798,121 +2966,119 @@ class RBCCommunityMap(QMainWindow):
         and transit coin actions in the HTML content, updating both bank and pocket coins in the
         SQLite database based on character_id.
         """
-        connection = sqlite3.connect(DB_PATH)
-        cursor = connection.cursor()
+        cursor = self._db.cursor()
 
         # Get the character ID for the selected character
         character_id = self.selected_character['id']
 
-        # Search for the bank balance line (found by "Welcome to Omnibank")
-        bank_match = re.search(r"Welcome to Omnibank. Your account has (\d+) coins in it.", html)
-
-        # Search for the pocket balance line (found by "You have \d+ coins")
-        pocket_match = re.search(r"You have (\d+) coins", html)
-
-        # Handle bank balance update
-        if bank_match:
-            bank_coins = int(bank_match.group(1))
-            logging.info(f"Bank coins found: {bank_coins}")
+        try:
+            # Search for the bank balance line (found by "Welcome to Omnibank")
+            bank_match = _BANK_BALANCE_RE.search(html)
 
-            # Update the bank coins in the SQLite database
-            cursor.execute('''
-                UPDATE coins 
-                SET bank = ? 
-                WHERE character_id = ?
-            ''', (bank_coins, character_id))
+            # Search for the pocket balance line (found by "You have \d+ coins")
+            pocket_match = _POCKET_BALANCE_RE.search(html)
 
-        # Handle pocket coin balance update
-        if pocket_match:
-            pocket_coins = int(pocket_match.group(1))
-            logging.info(f"Pocket coins found: {pocket_coins}")
+            # Handle bank balance update
+            if bank_match:
+                bank_coins = int(bank_match.group(1))
+                logging.info(f"Bank coins found: {bank_coins}")
 
-            # Update the pocket coins in the SQLite database
-            cursor.execute('''
-                UPDATE coins 
-                SET pocket = ? 
-                WHERE character_id = ?
-            ''', (pocket_coins, character_id))
-
-        # Handle deposit action (optional, depending on your needs)
-        deposit_match = re.search(r"You deposit (\d+) coins.", html)
-        if deposit_match:
-            deposit_coins = int(deposit_match.group(1))
-            logging.info(f"Deposit found: {deposit_coins} coins")
-
-            # Reduce the pocket coins by the deposited amount
-            cursor.execute('''
-                UPDATE coins
-                SET pocket = pocket - ?
-                WHERE character_id = ?
-            ''', (deposit_coins, character_id))
-
-        # Handle withdrawal action (optional, depending on your needs)
-        withdraw_match = re.search(r"You withdraw (\d+) coins.", html)
-        if withdraw_match:
-            withdraw_coins = int(withdraw_match.group(1))
-            logging.info(f"Withdrawal found: {withdraw_coins} coins")
-
-            # Increase the pocket coins by the withdrawn amount
-            cursor.execute('''
-                UPDATE coins
-                SET pocket = pocket + ?
-                WHERE character_id = ?
-            ''', (withdraw_coins, character_id))
-
-        # Handle transit coin update (optional, depending on your needs)
-        transit_match = re.search(r"It costs 5 coins to ride. You have (\d+).", html)
-        if transit_match:
-            coins_in_pocket = int(transit_match.group(1))
-            logging.info(f"Transit found: Pocket coins updated to {coins_in_pocket}")
-
-            # Explicitly set the pocket coin count after transit
-            cursor.execute('''
-                UPDATE coins
-                SET pocket = ?
-                WHERE character_id = ?
-            ''', (coins_in_pocket, character_id))
-
-        # Handle other coin-related actions (e.g., hunting, robbing, etc.)
-        actions = {
-            'hunter': r'You drink the hunter\'s blood.*You also found (\d+) coins',
-            'paladin': r'You drink the paladin\'s blood.*You also found (\d+) coins',
-            'human': r'You drink the human\'s blood.*You also found (\d+) coins',
-            'bag_of_coins': r'The bag contained (\d+) coins',
-            'robbing': r'You stole (\d+) coins from (\w+)',
-            'silver_suitcase': r'The suitcase contained (\d+) coins',
-            'given_coins': r'(\w+) gave you (\d+) coins',
-            'getting_robbed': r'(\w+) stole (\d+) coins from you'
-        }
+                # Update the bank coins in the SQLite database
+                cursor.execute('''
+                    UPDATE coins 
+                    SET bank = ? 
+                    WHERE character_id = ?
+                ''', (bank_coins, character_id))
 
-        # Handle other coin-related actions (e.g., hunting, robbing, etc.)
-        for action, pattern in actions.items():
-            match = re.search(pattern, html)
-            if match:
-                coin_count = int(match.group(1))
-                if action == 'getting_robbed':
-                    # Losing coins when robbed
-                    vamp_name = match.group(2)
-                    cursor.execute('''
-                        UPDATE coins
-                        SET pocket = pocket - ?
-                        WHERE character_id = ?
-                    ''', (coin_count, character_id))
-                    logging.info(f"Lost {coin_count} coins to {vamp_name}.")
-                else:
-                    # Gaining coins from hunting, robbing, etc.
-                    cursor.execute('''
-                        UPDATE coins
-                        SET pocket = pocket + ?
-                        WHERE character_id = ?
-                    ''', (coin_count, character_id))
-                    logging.info(f"Gained {coin_count} coins from {action}.")
-                break  # Exit loop after first match
+            # Handle pocket coin balance update
+            if pocket_match:
+                pocket_coins = int(pocket_match.group(1))
+                logging.info(f"Pocket coins found: {pocket_coins}")
 
-        connection.commit()
-        connection.close()
+                # Update the pocket coins in the SQLite database
+                cursor.execute('''
+                    UPDATE coins 
+                    SET pocket = ? 
+                    WHERE character_id = ?
+                ''', (pocket_coins, character_id))
+
+            # Handle deposit action (optional, depending on your needs)
+            deposit_match = _DEPOSIT_RE.search(html)
+            if deposit_match:
+                deposit_coins = int(deposit_match.group(1))
+                logging.info(f"Deposit found: {deposit_coins} coins")
+
+                # Reduce the pocket coins by the deposited amount
+                cursor.execute('''
+                    UPDATE coins
+                    SET pocket = pocket - ?
+                    WHERE character_id = ?
+                ''', (deposit_coins, character_id))
+
+            # Handle withdrawal action (optional, depending on your needs)
+            withdraw_match = _WITHDRAW_RE.search(html)
+            if withdraw_match:
+                withdraw_coins = int(withdraw_match.group(1))
+                logging.info(f"Withdrawal found: {withdraw_coins} coins")
+
+                # Increase the pocket coins by the withdrawn amount
+                cursor.execute('''
+                    UPDATE coins
+                    SET pocket = pocket + ?
+                    WHERE character_id = ?
+                ''', (withdraw_coins, character_id))
+
+            # Handle transit coin update (optional, depending on your needs)
+            transit_match = _TRANSIT_COINS_RE.search(html)
+            if transit_match:
+                coins_in_pocket = int(transit_match.group(1))
+                logging.info(f"Transit found: Pocket coins updated to {coins_in_pocket}")
+
+                # Explicitly set the pocket coin count after transit
+                cursor.execute('''
+                    UPDATE coins
+                    SET pocket = ?
+                    WHERE character_id = ?
+                ''', (coins_in_pocket, character_id))
+
+            # Handle other coin-related actions (e.g., hunting, robbing, etc.)
+            for action, pattern in _COIN_ACTION_PATTERNS:
+                match = pattern.search(html)
+                if match:
+                    coin_count = int(match.group('coins'))
+                    if action == 'getting_robbed':
+                        # Losing coins when robbed
+                        vamp_name = match.group('name')
+                        cursor.execute('''
+                            UPDATE coins
+                            SET pocket = pocket - ?
+                            WHERE character_id = ?
+                        ''', (coin_count, character_id))
+                        logging.info(f"Lost {coin_count} coins to {vamp_name}.")
+                    else:
+                        # Gaining coins from hunting, robbing, etc.
+                        cursor.execute('''
+                            UPDATE coins
+                            SET pocket = pocket + ?
+                            WHERE character_id = ?
+                        ''', (coin_count, character_id))
+                        logging.info(f"Gained {coin_count} coins from {action}.")
+                    break  # Exit loop after first match
+
+            # All updates above go out in one commit on the shared connection; a failure part way through is
+            # rolled back so no transaction is left open on the connection for later writes
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._db.rollback()
+            logging.error(f"Failed to update coins for character ID {character_id}: {e}")
+            return
         logging.info(f"Updated coins for character ID {character_id}.")
 
+        # The shopping list only re-reads the balances when told to, so push the change to an open tool
+        tool = getattr(self, 'shopping_list_tool', None)
+        if tool is not None and tool.isVisible() and tool._character_id == character_id:
+            tool.refresh_coins_label()
+
     def refresh_webview(self):
         """
         Refresh the webview content.
@@ -2945,8 +3111,8 @@ class RBCCommunityMap(QMainWindow):
         # Calculate font metrics for centering text
         font_metrics = QFontMetrics(font)
 
-        logging.debug(f"Drawing minimap with column_start={self.column_start}, row_start={self.row_start}, "
-                      f"zoom_level={self.zoom_level}, block_size={block_size}")
+        logging.debug("Drawing minimap with column_start=%s, row_start=%s, zoom_level=%s, block_size=%s",
+                      self.column_start, self.row_start, self.zoom_level, block_size)
 
         def draw_location(column_index, row_index, color, label_text=None):
             """
@@ -2958,7 +3124,7 @@ class RBCCommunityMap(QMainWindow):
                 color (QColor): Color to fill the location.
                 label_text (str, optional): Label text to draw at the location. Defaults to None.
             """
-            logging.debug(f"Location '{label_text}' Initial column_index={column_index}, row_index={row_index}")
+            logging.debug("Location '%s' Initial column_index=%s, row_index=%s", label_text, column_index, row_index)
             # Adjust offsets specifically for edge cases
             adjusted_column_index = column_index - 1 if column_index == 1 else column_index
             adjusted_row_index = row_index - 1 if row_index == 1 else row_index
@@ -2978,12 +3144,12 @@ class RBCCommunityMap(QMainWindow):
             # Ensure the adjusted location is within bounds
             if x0 < 0 or y0 < 0 or x0 >= self.minimap_size or y0 >= self.minimap_size:
                 logging.debug(
-                    f"Skipping drawing location '{label_text}' at column_index={column_index}, row_index={row_index}, "
-                    f"x0={x0}, y0={y0} (out of bounds)")
+                    "Skipping drawing location '%s' at column_index=%s, row_index=%s, x0=%s, y0=%s (out of bounds)",
+                    label_text, column_index, row_index, x0, y0)
                 return
 
-            logging.debug(f"Drawing location '{label_text}' at column_index={column_index}, row_index={row_index}, "
-                          f"x0={x0}, y0={y0}, color={color.name()}")
+            logging.debug("Drawing location '%s' at column_index=%s, row_index=%s, x0=%s, y0=%s, color=%s",
+                          label_text, column_index, row_index, x0, y0, color.name())
 
             # Draw a smaller rectangle within the cell
             inner_margin = block_size // 4
@@ -3009,16 +3175,16 @@ class RBCCommunityMap(QMainWindow):
                 row_index = self.row_start + i
 
                 x0, y0 = j * block_size, i * block_size
-                logging.debug(f"Drawing grid cell at column_index={column_index}, row_index={row_index}, "
-                              f"x0={x0}, y0={y0}")
+                logging.debug("Drawing grid cell at column_index=%s, row_index=%s, x0=%s, y0=%s",
+                              column_index, row_index, x0, y0)
 
                 # Draw the cell background
                 painter.setPen(QColor('white'))
                 painter.drawRect(x0, y0, block_size - border_size, block_size - border_size)
 
                 # Special location handling
-                column_name = next((name for name, coord in self.columns.items() if coord == column_index), None)
-                row_name = next((name for name, coord in self.rows.items() if coord == row_index), None)
+                column_name = self.street_name_at(self._col_name_at, column_index)
+                row_name = self.street_name_at(self._row_name_at, row_index)
 
                 # Draw cell background color
                 if column_index <= 0 or column_index >= 201 or row_index <= 0 or row_index >= 201:
@@ -3047,56 +3213,21 @@ class RBCCommunityMap(QMainWindow):
                     painter.setPen(QColor('white'))
                     painter.drawText(text_rect, Qt.AlignCenter | Qt.TextWordWrap, label_text)
 
-        # Draw special locations (banks with correct offsets)
-        for (col_name, row_name, _, _) in self.banks_coordinates:
-            column_index = self.columns.get(col_name)
-            row_index = self.rows.get(row_name)
-            if column_index is not None and row_index is not None:
-                # Add +1,+1 offset specifically for banks
-                adjusted_column_index = column_index + 1
-                adjusted_row_index = row_index + 1
-                draw_location(adjusted_column_index, adjusted_row_index, self.color_mappings["bank"], "Bank")
-            else:
-                logging.warning(f"Skipping bank at {col_name} & {row_name} due to missing coordinates")
-
-        # Draw other locations without the offset
-        for name, (column_index, row_index) in self.taverns_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["tavern"], name)
-
-        for name, (column_index, row_index) in self.transits_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["transit"], name)
-
-        for name, (column_index, row_index) in self.user_buildings_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["user_building"], name)
-
-        for name, (column_index, row_index) in self.shops_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["shop"], name)
-
-        for name, (column_index, row_index) in self.guilds_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["guild"], name)
-
-        for name, (column_index, row_index) in self.places_of_interest_coordinates.items():
-            if column_index is not None and row_index is not None:
-                draw_location(column_index, row_index, self.color_mappings["placesofinterest"], name)
-            else:
-                logging.warning(f"Skipping place of interest '{name}' due to missing coordinates")
+        # Draw special locations, visiting only the visible cells of the location index
+        for row_index in range(self.row_start, self.row_start + self.zoom_level):
+            for column_index in range(self.column_start, self.column_start + self.zoom_level):
+                for color_key, label_text in self._locations_by_cell.get((column_index, row_index), ()):
+                    draw_location(column_index, row_index, self.color_mappings[color_key], label_text)
 
         # Get current location
         current_x, current_y = self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
 
         # Find and draw lines to nearest locations
-        nearest_tavern = self.find_nearest_tavern(current_x, current_y)
-        nearest_bank = self.find_nearest_bank(current_x, current_y)
-        nearest_transit = self.find_nearest_transit(current_x, current_y)
+        nearest_tavern, nearest_bank, nearest_transit = self.find_nearest_services(current_x, current_y)
 
         # Draw nearest tavern line
         if nearest_tavern:
-            nearest_tavern_coords = nearest_tavern[0][1]
+            nearest_tavern_coords = nearest_tavern[1]
             painter.setPen(QPen(QColor('orange'), 3))  # Set pen color to orange and width to 3
             painter.drawLine(
                 (current_x - self.column_start) * block_size + block_size // 2,
@@ -3107,18 +3238,18 @@ class RBCCommunityMap(QMainWindow):
 
         # Draw nearest bank line
         if nearest_bank:
-            nearest_bank_coords = nearest_bank[0][1]
+            nearest_bank_coords = nearest_bank[1]
             painter.setPen(QPen(QColor('blue'), 3))  # Set pen color to blue and width to 3
             painter.drawLine(
                 (current_x - self.column_start) * block_size + block_size // 2,
                 (current_y - self.row_start) * block_size + block_size // 2,
-                (nearest_bank_coords[0] + 1 - self.column_start) * block_size + block_size // 2,
-                (nearest_bank_coords[1] + 1 - self.row_start) * block_size + block_size // 2
+                (nearest_bank_coords[0] - self.column_start) * block_size + block_size // 2,
+                (nearest_bank_coords[1] - self.row_start) * block_size + block_size // 2
             )
 
         # Draw nearest transit line
         if nearest_transit:
-            nearest_transit_coords = nearest_transit[0][1]
+            nearest_transit_coords = nearest_transit[1]
             painter.setPen(QPen(QColor('red'), 3))  # Set pen color to red and width to 3
             painter.drawLine(
                 (current_x - self.column_start) * block_size + block_size // 2,
@@ -3145,10 +3276,80 @@ class RBCCommunityMap(QMainWindow):
         Update the minimap.
 
         Calls draw_minimap and then updates the info frame with any relevant information.
+        Nothing is redrawn when the view is identical to the last paint.
         """
+        paint_state = (self.column_start, self.row_start, self.zoom_level, self.destination)
+        if paint_state == self._last_paint_state:
+            return
+        self._last_paint_state = paint_state
+
         self.draw_minimap()
         self.update_info_frame()
 
+    def build_location_index(self):
+        """
+        Build the coordinate lists used by the nearest-location searches and the minimap.
+
+        Banks are stored like every other building: as the cell south-east of their intersection, so the
+        minimap, the searches and the AP costs all use the same coordinates. The coordinate-to-name
+        lookups used by the info frame are inverted once as well.
+        Must be called again whenever the map data is reloaded.
+        """
+        self._tavern_xy = list(self.taverns_coordinates.values())
+        self._transit_xy = list(self.transits_coordinates.values())
+
+        self._bank_xy = []
+        for col, row, col_index, row_index in self.banks_coordinates:
+            if col_index is None or row_index is None:
+                logging.warning(
+                    f"Bank location with column '{col}' and row '{row}' could not be found in the available columns or rows.")
+                continue
+            self._bank_xy.append((col_index + 1, row_index + 1))
+
+        # Bank labels for the destination dialog, formatted once per reload rather than on every dialog open
+        self.banks_display = [f"{col} & {row}" for col, row, _, _ in self.banks_coordinates]
+
+        # Drawable locations bucketed by cell in draw order (banks first, places of interest last),
+        # so a minimap paint only visits the zoom_level x zoom_level visible cells
+        self._locations_by_cell = {}
+        for coords in self._bank_xy:
+            self._locations_by_cell.setdefault(coords, []).append(("bank", "Bank"))
+        for color_key, locations in (("tavern", self.taverns_coordinates),
+                                     ("transit", self.transits_coordinates),
+                                     ("user_building", self.user_buildings_coordinates),
+                                     ("shop", self.shops_coordinates),
+                                     ("guild", self.guilds_coordinates),
+                                     ("placesofinterest", self.places_of_interest_coordinates)):
+            for name, coords in locations.items():
+                self._locations_by_cell.setdefault(coords, []).append((color_key, name))
+
+        # Reverse lookups (coordinates -> name)
+        self._tavern_name_by_coord = {coords: name for name, coords in self.taverns_coordinates.items()}
+        self._transit_name_by_coord = {coords: name for name, coords in self.transits_coordinates.items()}
+
+        # Named places a destination can point at; places of interest win when they share a cell
+        self._place_name_by_coord = {}
+        for places in (self.guilds_coordinates, self.shops_coordinates,
+                       self.user_buildings_coordinates, self.places_of_interest_coordinates):
+            self._place_name_by_coord.update({coords: name for name, coords in places.items()})
+
+        # Street names indexed by coordinate (index == coordinate)
+        self._col_name_at = [None] * (max(self.columns.values(), default=-1) + 1)
+        for name, coord in self.columns.items():
+            self._col_name_at[coord] = name
+        self._row_name_at = [None] * (max(self.rows.values(), default=-1) + 1)
+        for name, coord in self.rows.items():
+            self._row_name_at[coord] = name
+
+        # Force the searches, the minimap and the info frame to recompute against the new data
+        self._nearest_transit_cache = {}
+        self._nearest_services_key = None
+        self._last_paint_state = None
+        self._info_cache_key = None
+
+        logging.debug(f"Location index built: {len(self._bank_xy)} banks, {len(self._transit_xy)} transits, "
+                      f"{len(self._tavern_xy)} taverns")
+
     def find_nearest_location(self, x, y, locations):
         """
         Find the nearest location to the given coordinates.
@@ -3159,15 +3360,35 @@ class RBCCommunityMap(QMainWindow):
             locations (list): List of location coordinates.
 
         Returns:
-            list: List of distances and corresponding coordinates.
+            tuple: (distance, coordinates) of the nearest location, or None if there are no locations.
+                Ties are broken by the lowest coordinates.
+        """
+        # Only the closest entry is ever used, so a single min() pass replaces building and sorting
+        # the full list (Chebyshev distance)
+        return min(((max(abs(lx - x), abs(ly - y)), (lx, ly)) for lx, ly in locations), default=None)
+
+    def find_nearest_services(self, x, y):
+        """
+        Find the nearest tavern, bank and transit station to the given coordinates.
+
+        The result for the last position is kept so that draw_minimap and update_info_frame share
+        one set of searches per refresh. The cache is reset by build_location_index.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            tuple: Nearest tavern, bank and transit results, as returned by the find_nearest_* methods.
         """
-        distances = []
-        for loc in locations:
-            lx, ly = loc
-            dist = max(abs(lx - x), abs(ly - y))  # Using Chebyshev distance
-            distances.append((dist, (lx, ly)))
-        distances.sort()
-        return distances
+        if self._nearest_services_key != (x, y):
+            self._nearest_services = (
+                self.find_nearest_tavern(x, y),
+                self.find_nearest_bank(x, y),
+                self.find_nearest_transit(x, y),
+            )
+            self._nearest_services_key = (x, y)
+        return self._nearest_services
 
     def find_nearest_tavern(self, x, y):
         """
@@ -3178,9 +3399,9 @@ class RBCCommunityMap(QMainWindow):
             y (int): Y coordinate.
 
         Returns:
-            list: List of distances and corresponding coordinates.
+            tuple: (distance, coordinates) of the nearest match, or None.
         """
-        return self.find_nearest_location(x, y, list(self.taverns_coordinates.values()))
+        return self.find_nearest_location(x, y, self._tavern_xy)
 
     def find_nearest_bank(self, x, y):
         """
@@ -3191,37 +3412,35 @@ class RBCCommunityMap(QMainWindow):
             y (int): Y coordinate.
 
         Returns:
-            list: List of distances and corresponding coordinates.
+            tuple: (distance, coordinates) of the nearest match, or None.
         """
-        valid_banks = []
-        for col, row, _, _ in self.banks_coordinates:
-            try:
-                col_index = self.columns[col]
-                row_index = self.rows[row]
-            except KeyError:
-                logging.warning(
-                    f"Bank location with column '{col}' and row '{row}' could not be found in the available columns or rows.")
-                continue
-            valid_banks.append((col_index, row_index))
-
-        if not valid_banks:
+        if not self._bank_xy:
             logging.warning("No valid bank locations found.")
             return None
 
-        return self.find_nearest_location(x, y, valid_banks)
+        return self.find_nearest_location(x, y, self._bank_xy)
 
     def find_nearest_transit(self, x, y):
         """
         Find the nearest transit station to the given coordinates.
 
+        Results are memoized per grid cell, since the minimap and the info frame both ask for the
+        character's nearest transit on every refresh. The cache is reset by build_location_index.
+
         Args:
             x (int): X coordinate.
             y (int): Y coordinate.
 
         Returns:
-            list: List of distances and corresponding coordinates.
+            tuple: (distance, coordinates) of the nearest match, or None.
         """
-        return self.find_nearest_location(x, y, list(self.transits_coordinates.values()))
+        key = (x, y)
+        cached = self._nearest_transit_cache.get(key)
+        if cached is None:
+            if len(self._nearest_transit_cache) >= 4096:
+                self._nearest_transit_cache.clear()
+            cached = self._nearest_transit_cache[key] = self.find_nearest_location(x, y, self._transit_xy)
+        return cached
 
     def set_destination(self):
         """
@@ -3235,11 +3454,8 @@ class RBCCommunityMap(QMainWindow):
         """
         Retrieve the latest destination from the SQLite database.
         """
-        connection = sqlite3.connect(DB_PATH)
-        cursor = connection.cursor()
-        cursor.execute("SELECT col, row FROM destinations ORDER BY timestamp DESC LIMIT 1")
-        result = cursor.fetchone()
-        connection.close()
+        cursor = self._db.cursor()
+        result = cursor.execute(_SQL_GET_DESTINATION).fetchone()
         return (result[0], result[1]) if result else None
 
     def load_destination(self):
@@ -3265,6 +3481,7 @@ class RBCCommunityMap(QMainWindow):
         """
         if self.zoom_level > 3:
             self.zoom_level -= 2  # Reduce by 2 to keep zoom levels odd-numbered
+            self._zp = ZOOM_PARAMS[self.zoom_level]
             self.save_zoom_level_to_database()  # Save the updated zoom level
             self.website_frame.page().toHtml(self.process_html)
 
@@ -3274,6 +3491,7 @@ class RBCCommunityMap(QMainWindow):
         """
         if self.zoom_level < 7:  # Adjusted max level to improve readability
             self.zoom_level += 2  # Increase by 2 to keep zoom levels odd-numbered
+            self._zp = ZOOM_PARAMS[self.zoom_level]
             self.save_zoom_level_to_database()  # Save the updated zoom level
             self.website_frame.page().toHtml(self.process_html)
 
@@ -3282,20 +3500,13 @@ class RBCCommunityMap(QMainWindow):
         Save the current zoom level to the settings table in the database.
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
-            query = """
-            INSERT INTO settings (setting_name, setting_value)
-            VALUES ('minimap_zoom', ?)
-            ON CONFLICT(setting_name) DO UPDATE SET setting_value = ?;
-            """
-            cursor.execute(query, (self.zoom_level, self.zoom_level))
-            connection.commit()
+            cursor = self._db.cursor()
+            cursor.execute(_SQL_SAVE_SETTING, ('minimap_zoom', self.zoom_level))
+            self._db.commit()
             logging.debug(f"Zoom level saved to database: {self.zoom_level}")
         except sqlite3.Error as e:
+            self._db.rollback()
             logging.error(f"Failed to save zoom level to database: {e}")
-        finally:
-            connection.close()
 
     def load_zoom_level_from_database(self):
         """
@@ -3303,10 +3514,8 @@ class RBCCommunityMap(QMainWindow):
         If no value is found, set it to the default (3).
         """
         try:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
-            query = "SELECT setting_value FROM settings WHERE setting_name = 'minimap_zoom';"
-            result = cursor.execute(query).fetchone()
+            cursor = self._db.cursor()
+            result = cursor.execute(_SQL_LOAD_SETTING, ('minimap_zoom',)).fetchone()
             if result:
                 self.zoom_level = int(result[0])
                 logging.debug(f"Zoom level loaded from database: {self.zoom_level}")
@@ -3316,8 +3525,11 @@ class RBCCommunityMap(QMainWindow):
         except sqlite3.Error as e:
             self.zoom_level = 3  # Fallback default zoom level
             logging.error(f"Failed to load zoom level from database: {e}")
-        finally:
-            connection.close()
+
+        if self.zoom_level not in ZOOM_PARAMS:
+            logging.warning(f"Unsupported zoom level {self.zoom_level} in database. Defaulting to 3.")
+            self.zoom_level = 3
+        self._zp = ZOOM_PARAMS[self.zoom_level]
 
     def recenter_minimap(self):
         """
@@ -3328,8 +3540,7 @@ class RBCCommunityMap(QMainWindow):
             logging.error("Character position not set. Cannot recenter minimap.")
             return
 
-        # Calculate zoom offset (-1 for 5x5, -2 for 7x7, etc.)
-        zoom_offset = (self.zoom_level - 4) // 2
+        zoom_offset = self._zp['recenter_offset']
 
         # Calculate starting positions to center the character
         column_start = self.character_x - zoom_offset
@@ -3360,13 +3571,13 @@ class RBCCommunityMap(QMainWindow):
         row_name = self.combo_rows.currentText()
 
         if column_name in self.columns:
-            self.column_start = self.columns[column_name] - self.zoom_level // 2
+            self.column_start = self.columns[column_name] - self._zp['center']
             logging.debug(f"Set column_start to {self.column_start} for column '{column_name}'")
         else:
             logging.error(f"Column '{column_name}' not found in self.columns")
 
         if row_name in self.rows:
-            self.row_start = self.rows[row_name] - self.zoom_level // 2
+            self.row_start = self.rows[row_name] - self._zp['center']
             logging.debug(f"Set row_start to {self.row_start} for row '{row_name}'")
         else:
             logging.error(f"Row '{row_name}' not found in self.rows")
@@ -3391,12 +3602,10 @@ class RBCCommunityMap(QMainWindow):
                 clicked_column = self.column_start + (relative_x // block_size)
                 clicked_row = self.row_start + (relative_y // block_size)
 
-                # Calculate new center positions
-                center_offset = self.zoom_level // 2
-
-                # Allow extended bounds
-                min_start = -(self.zoom_level // 2)
-                max_start = 201 + (self.zoom_level // 2) - self.zoom_level
+                # Center offset and extended bounds for the current zoom level
+                center_offset = self._zp['center']
+                min_start = self._zp['min_start']
+                max_start = self._zp['max_start']
 
                 new_column_start = clicked_column - center_offset
                 new_row_start = clicked_row - center_offset
@@ -3423,15 +3632,13 @@ class RBCCommunityMap(QMainWindow):
         Open the set destination dialog.
 
         Opens a dialog that allows the user to set a destination. If the user confirms the destination,
-        it loads the destination and updates the minimap.
+        the minimap is redrawn with it.
         """
         dialog = set_destination_dialog(self)
 
-        # Execute dialog and check for acceptance
+        # Execute dialog and check for acceptance. The dialog updates self.destination together with its
+        # database write, so the in-memory value is already current and the destination is not re-queried.
         if dialog.exec() == QDialog.Accepted:
-            # Load the newly set destination from the database
-            self.load_destination()
-
             # Update the minimap with the new destination
             self.update_minimap()
 
@@ -3447,29 +3654,23 @@ class RBCCommunityMap(QMainWindow):
         if destination_coords is None or character_id is None:
             return
 
-        connection = sqlite3.connect(DB_PATH)
-        cursor = connection.cursor()
+        cursor = self._db.cursor()
 
         try:
-            # Insert the new destination with character_id
-            cursor.execute("INSERT INTO recent_destinations (character_id, col, row) VALUES (?, ?, ?)",
-                           (character_id, *destination_coords))
+            # Insert and prune in a single write transaction (one commit instead of two)
+            with self._db:
+                cursor.execute("BEGIN IMMEDIATE")
 
-            # Keep only the 10 most recent destinations per character
-            cursor.execute("""
-                DELETE FROM recent_destinations 
-                WHERE character_id = ? AND id NOT IN (
-                    SELECT id FROM recent_destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 10
-                )
-            """, (character_id, character_id))
+                # Insert the new destination with character_id
+                cursor.execute(_SQL_INSERT_RECENT_DESTINATION, (character_id, *destination_coords))
+
+                # Keep only the 10 most recent destinations per character
+                cursor.execute(_SQL_PRUNE_RECENT_DESTINATIONS, (character_id, character_id))
 
-            connection.commit()
             logging.info(
                 f"Destination {destination_coords} saved to recent destinations for character ID {character_id}.")
         except sqlite3.Error as e:
             logging.error(f"Failed to save recent destination: {e}")
-        finally:
-            connection.close()
 
     # -----------------------
     # Infobar Management
@@ -3494,30 +3695,34 @@ class RBCCommunityMap(QMainWindow):
         """
         current_x, current_y = self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
 
+        # The labels only depend on the position and the destination; skip the work if neither changed
+        info_key = (current_x, current_y, self.destination)
+        if info_key == self._info_cache_key:
+            return
+
+        # Reuses the searches draw_minimap just ran for the same cell
+        nearest_tavern, nearest_bank, nearest_transit = self.find_nearest_services(current_x, current_y)
+
         # Closest Bank
-        nearest_bank = self.find_nearest_bank(current_x, current_y)
         if nearest_bank:
-            bank_coords = nearest_bank[0][1]
-            adjusted_bank_coords = (bank_coords[0] + 1, bank_coords[1] + 1)
-            bank_ap_cost = self.calculate_ap_cost((current_x, current_y), adjusted_bank_coords)
-            bank_intersection = self.get_intersection_name(adjusted_bank_coords)
+            bank_coords = nearest_bank[1]
+            bank_ap_cost = nearest_bank[0]
+            bank_intersection = self.get_intersection_name(bank_coords)
             self.bank_label.setText(f"Bank\n{bank_intersection} - AP: {bank_ap_cost}")
 
         # Closest Transit
-        nearest_transit = self.find_nearest_transit(current_x, current_y)
         if nearest_transit:
-            transit_coords = nearest_transit[0][1]
-            transit_name = next(name for name, coords in self.transits_coordinates.items() if coords == transit_coords)
-            transit_ap_cost = self.calculate_ap_cost((current_x, current_y), transit_coords)
+            transit_coords = nearest_transit[1]
+            transit_name = self._transit_name_by_coord.get(transit_coords)
+            transit_ap_cost = nearest_transit[0]  # Chebyshev distance already computed by the search
             transit_intersection = self.get_intersection_name(transit_coords)
             self.transit_label.setText(f"Transit - {transit_name}\n{transit_intersection} - AP: {transit_ap_cost}")
 
         # Closest Tavern
-        nearest_tavern = self.find_nearest_tavern(current_x, current_y)
         if nearest_tavern:
-            tavern_coords = nearest_tavern[0][1]
-            tavern_name = next(name for name, coords in self.taverns_coordinates.items() if coords == tavern_coords)
-            tavern_ap_cost = self.calculate_ap_cost((current_x, current_y), tavern_coords)
+            tavern_coords = nearest_tavern[1]
+            tavern_name = self._tavern_name_by_coord.get(tavern_coords)
+            tavern_ap_cost = nearest_tavern[0]
             tavern_intersection = self.get_intersection_name(tavern_coords)
             self.tavern_label.setText(f"{tavern_name}\n{tavern_intersection} - AP: {tavern_ap_cost}")
 
@@ -3527,30 +3732,26 @@ class RBCCommunityMap(QMainWindow):
             destination_ap_cost = self.calculate_ap_cost((current_x, current_y), destination_coords)
             destination_intersection = self.get_intersection_name(destination_coords)
             # Check for a named place at destination
-            place_name = next(
-                (name for name, coords in self.places_of_interest_coordinates.items() if coords == destination_coords),
-                None
-            )
+            place_name = self._place_name_by_coord.get(destination_coords)
             destination_label_text = f"Set Destination - {place_name}" if place_name else "Set Destination"
             self.destination_label.setText(
                 f"{destination_label_text}\n{destination_intersection} - AP: {destination_ap_cost}")
 
-            # Transit-Based AP Cost for Set Destination
-            nearest_transit_to_character = self.find_nearest_transit(current_x, current_y)
+            # Transit-Based AP Cost for Set Destination (the character's side was found above)
+            nearest_transit_to_character = nearest_transit
             nearest_transit_to_destination = self.find_nearest_transit(destination_coords[0], destination_coords[1])
 
             if nearest_transit_to_character and nearest_transit_to_destination:
-                char_transit_coords = nearest_transit_to_character[0][1]
-                dest_transit_coords = nearest_transit_to_destination[0][1]
-                char_to_transit_ap = self.calculate_ap_cost((current_x, current_y), char_transit_coords)
-                dest_to_transit_ap = self.calculate_ap_cost(destination_coords, dest_transit_coords)
+                char_transit_coords = nearest_transit_to_character[1]
+                dest_transit_coords = nearest_transit_to_destination[1]
+                # The nearest-transit searches already returned the AP distance to each stop
+                char_to_transit_ap = nearest_transit_to_character[0]
+                dest_to_transit_ap = nearest_transit_to_destination[0]
                 total_ap_via_transit = char_to_transit_ap + dest_to_transit_ap
 
                 # Get transit names
-                char_transit_name = next(
-                    name for name, coords in self.transits_coordinates.items() if coords == char_transit_coords)
-                dest_transit_name = next(
-                    name for name, coords in self.transits_coordinates.items() if coords == dest_transit_coords)
+                char_transit_name = self._transit_name_by_coord.get(char_transit_coords)
+                dest_transit_name = self._transit_name_by_coord.get(dest_transit_coords)
 
                 # Update the transit destination label
                 self.transit_destination_label.setText(
@@ -3560,10 +3761,15 @@ class RBCCommunityMap(QMainWindow):
             else:
                 self.transit_destination_label.setText("Transit Route Info Unavailable")
 
-        else:
-            # Clear labels when no destination is set
+            self._labels_state = "dest"
+
+        elif self._labels_state != "no_dest":
+            # Clear labels when no destination is set; they keep this text until a destination is set
             self.destination_label.setText("No Destination Set")
             self.transit_destination_label.setText("No Destination Set")
+            self._labels_state = "no_dest"
+
+        self._info_cache_key = info_key
 
     def get_intersection_name(self, coords):
         """
@@ -3577,22 +3783,30 @@ class RBCCommunityMap(QMainWindow):
         """
         x, y = coords
 
-        # Special cases for edges of the map
-        if x <= min(self.columns.values()) - 1:
-            column_name = "Edge of Map"
-        else:
-            column_name = next((name for name, coord in self.columns.items() if coord == x - 1), "Edge of Map")
-
-        if y <= min(self.rows.values()) - 1:
-            row_name = "Edge of Map"
-        else:
-            row_name = next((name for name, coord in self.rows.items() if coord == y - 1), "Edge of Map")
+        # Anything before the first street (or otherwise unnamed) is the edge of the map
+        column_name = self.street_name_at(self._col_name_at, x - 1)
+        row_name = self.street_name_at(self._row_name_at, y - 1)
 
-        if column_name == "Edge of Map" or row_name == "Edge of Map":
+        if column_name is None or row_name is None:
             return "Edge of Map"
         else:
             return f"{column_name} & {row_name}"
 
+    def street_name_at(self, names, coordinate):
+        """
+        Look up a street name by its coordinate.
+
+        Args:
+            names (list): Street names indexed by coordinate (self._col_name_at or self._row_name_at).
+            coordinate (int): Column or row coordinate.
+
+        Returns:
+            str: Street name, or None if no street has that coordinate.
+        """
+        if 0 <= coordinate < len(names):
+            return names[coordinate]
+        return None
+
     # -----------------------
     # Menu Actions
     # -----------------------
@@ -3664,24 +3878,38 @@ class RBCCommunityMap(QMainWindow):
         credits_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         credits_label.setWordWrap(True)
 
-        scroll_area.setWidget(credits_label)
-
-        credits_label.setGeometry(0, scroll_area.height(), scroll_area.width(), credits_label.sizeHint().height())
-
-        # Create and start the scrolling animation
-        animation = QPropertyAnimation(credits_label, b"geometry")
-        animation.setDuration(35000)  # 30 seconds
-        animation.setStartValue(QRect(0, scroll_area.height(), scroll_area.width(), credits_label.sizeHint().height()))
-        animation.setEndValue(
-            QRect(0, -credits_label.sizeHint().height(), scroll_area.width(), credits_label.sizeHint().height()))
-        animation.setEasingCurve(QEasingCurve.Type.Linear)
-
-        # Close dialog 5 seconds after the animation finishes
-        def close_after_delay():
-            QTimer.singleShot(2500, credits_dialog.accept)  # Wait 2.5 seconds before closing
+        # The text is laid out once and rendered to a pixmap; scrolling only moves that pixmap
+        pixmap_label = QLabel()
+        pixmap_label.setStyleSheet("background-color: black;")
+        scroll_area.setWidget(pixmap_label)
+
+        scroll_duration = 35000  # 35 seconds
+        frame_interval = 33  # ~30 frames per second
+        scroll_state = {}
+
+        def scroll_credits():
+            if not scroll_state:
+                # First tick: the dialog is shown, so the viewport has its final size
+                viewport = scroll_area.viewport()
+                credits_label.setFixedWidth(viewport.width())
+                credits_label.adjustSize()
+                pixmap_label.setPixmap(credits_label.grab())
+                pixmap_label.resize(credits_label.size())
+                scroll_state['y'] = float(viewport.height())
+                scroll_state['end'] = -credits_label.height()
+                scroll_state['step'] = (scroll_state['y'] - scroll_state['end']) * frame_interval / scroll_duration
+
+            scroll_state['y'] -= scroll_state['step']
+            if scroll_state['y'] <= scroll_state['end']:
+                scroll_timer.stop()
+                QTimer.singleShot(2500, credits_dialog.accept)  # Wait 2.5 seconds before closing
+                return
+            pixmap_label.move(0, int(scroll_state['y']))
 
-        animation.finished.connect(close_after_delay)
-        animation.start()
+        scroll_timer = QTimer(credits_dialog)
+        scroll_timer.setInterval(frame_interval)
+        scroll_timer.timeout.connect(scroll_credits)
+        scroll_timer.start()
 
         credits_dialog.exec()
 
@@ -3692,15 +3920,12 @@ class RBCCommunityMap(QMainWindow):
         """
         Open the database viewer to browse and inspect data from the RBC City Map database.
 
-        This method connects to the SQLite database, fetches the data from specified tables,
+        The viewer shares the main window's SQLite connection, fetches the data from specified tables,
         and displays it in a new DatabaseViewer window.
         """
         try:
-            # Create a new SQLite database connection every time the viewer is opened
-            database_connection = sqlite3.connect(DB_PATH)
-
-            # Show the database viewer, passing the new connection
-            self.database_viewer = DatabaseViewer(database_connection)
+            # Show the database viewer on the shared connection; the viewer must not close it
+            self.database_viewer = DatabaseViewer(self._db, owns_connection=False)
             self.database_viewer.show()
 
         except Exception as e:
@@ -3718,17 +3943,137 @@ class RBCCommunityMap(QMainWindow):
         Returns:
             Tuple: (List of column names, List of table data)
         """
-        cursor.execute(f"PRAGMA table_info(`{table_name}`)")
-        column_names = [col[1] for col in cursor.fetchall()]
+        column_names = [col[1] for col in cursor.execute(f"PRAGMA table_info(`{table_name}`)").fetchall()]
 
-        cursor.execute(f"SELECT * FROM `{table_name}`")
-        data = cursor.fetchall()
+        data = cursor.execute(f"SELECT * FROM `{table_name}`").fetchall()
 
         return column_names, data
 
+    def closeEvent(self, event):
+        """
+        Close the shared SQLite connection when the main window is closed.
+        """
+        self._db.execute("PRAGMA optimize")
+        self._db.close()
+        event.accept()
+
 # -----------------------
 # Tools
 # -----------------------
+class SqlTableModel(QAbstractTableModel):
+    """
+    Read-only table model over rows fetched from SQLite.
+
+    The rows are kept as the raw tuples returned by the cursor. Cell text is only produced in data(),
+    for the cells the view actually paints, by a converter chosen per column from its declared type.
+    When given a fetch_page function, rows are loaded a page at a time as the view scrolls towards the end.
+    Pages are keyed on the rowid of the last loaded row rather than an offset, so rows inserted or deleted
+    while the view is open do not shift the pages that are still to come.
+    """
+
+    def __init__(self, column_names, rows=None, parent=None, column_types=None, fetch_page=None, page_size=1000):
+        """
+        Initialize the model.
+
+        Args:
+            column_names (list): Column names shown in the horizontal header.
+            rows (list, optional): Initial list of row tuples. Stored by reference, not copied.
+            parent (QObject, optional): Parent object.
+            column_types (list, optional): Declared SQLite type of each column, as reported by PRAGMA table_info.
+            fetch_page (callable, optional): fetch_page(after_rowid, limit) returning the next rows with a rowid
+                greater than after_rowid, in rowid order, each tuple starting with the rowid. The rowid is
+                dropped before the row is stored.
+            page_size (int): Number of rows requested from fetch_page at a time.
+        """
+        super().__init__(parent)
+        self.column_names = column_names
+        self.rows = rows if rows is not None else []
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.exhausted = fetch_page is None
+        self.last_rowid = None  # rowid of the last row loaded through fetch_page
+        types = column_types if column_types is not None else [""] * len(column_names)
+        self.converters = [self.converter_for(declared_type) for declared_type in types]
+
+    @staticmethod
+    def cell_text(value):
+        """
+        Convert any SQLite value to display text, showing NULL as an empty cell.
+        """
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def text_cell_text(value):
+        """
+        Convert a value from a TEXT column, where it is almost always a str already and needs no conversion.
+        """
+        return value if type(value) is str else SqlTableModel.cell_text(value)
+
+    @classmethod
+    def converter_for(cls, declared_type):
+        """
+        Pick the display converter for a column from its declared type, following SQLite's affinity rules.
+
+        Args:
+            declared_type (str): The declared column type, e.g. "TEXT" or "VARCHAR(20)".
+
+        Returns:
+            callable: A function turning a cell value into its display text.
+        """
+        declared_type = (declared_type or "").upper()
+        if "INT" not in declared_type and any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+            return cls.text_cell_text
+        return cls.cell_text
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.column_names)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.column_names[section]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        column = index.column()
+        return self.converters[column](self.rows[index.row()][column])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Load the next page of rows; called by the view when it scrolls near the last loaded row.
+        """
+        if parent.isValid() or self.exhausted:
+            return
+        rows = self.fetch_page(self.last_rowid, self.page_size)
+        if len(rows) < self.page_size:
+            self.exhausted = True  # A short page means the end of the table was reached
+        if rows:
+            self.last_rowid = rows[-1][0]
+        self.append_rows([row[1:] for row in rows])
+
+    def append_rows(self, rows):
+        """
+        Append a chunk of row tuples to the model.
+
+        Args:
+            rows (list): Row tuples to append.
+        """
+        if not rows:
+            return
+        first_row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
 class DatabaseViewer(QMainWindow):
     """
     Main application class for viewing database tables.
@@ -3737,12 +4082,17 @@ class DatabaseViewer(QMainWindow):
     in a tabbed layout, allowing users to easily browse and inspect the data.
     """
 
-    def __init__(self, db_connection):
+    # Column names and declared types per table, kept for the session since the schema does not change
+    _col_cache = {}
+
+    def __init__(self, db_connection, owns_connection=True):
         """
         Initialize the DatabaseViewer with the provided table data.
 
         Args:
             db_connection: The established SQLite database connection.
+            owns_connection (bool): Whether the viewer should close the connection when it is closed.
+                Pass False when the connection is shared with the main window.
         """
         super().__init__()
         self.setWindowTitle('SQLite Database Viewer')
@@ -3753,64 +4103,95 @@ class DatabaseViewer(QMainWindow):
         self.setCentralWidget(self.tab_widget)
 
         self.db_connection = db_connection
+        self.owns_connection = owns_connection
         self.cursor = self.db_connection.cursor()
+        self.page_size = 1000  # Rows loaded per page as a table is scrolled
 
         # Query to get all table names
         self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = self.cursor.fetchall()
 
         for (table_name,) in tables:
-            column_names, data = self.get_table_data(table_name)
-            self.add_table_tab(table_name, column_names, data)
+            column_names, column_types, fetch_page = self.get_table_data(table_name)
+            self.add_table_tab(table_name, column_names, fetch_page, column_types)
 
     def get_table_data(self, table_name):
         """
-        Fetch the column names and data for a given table.
+        Fetch the column names for a given table and a function that loads its rows page by page.
 
         Args:
             table_name: The name of the table to fetch data from.
 
         Returns:
-            A tuple containing a list of column names and the data.
+            A tuple containing a list of column names, a list of their declared types and a
+            fetch_page(after_rowid, limit) function returning the rows of one page, each prefixed with its rowid.
         """
-        # Use PRAGMA to get column information and SELECT to fetch data
-        self.cursor.execute(f"PRAGMA table_info(`{table_name}`)")
-        column_names = [col[1] for col in self.cursor.fetchall()]
+        column_names, column_types = self.get_column_info(table_name)
+        # Keyset paging: each page seeks straight past the last rowid shown, so deeper pages do not re-scan the
+        # earlier rows and writes made by the main window on the shared connection do not skip or repeat rows
+        first_query = f"SELECT rowid, * FROM `{table_name}` ORDER BY rowid LIMIT ?"
+        next_query = f"SELECT rowid, * FROM `{table_name}` WHERE rowid > ? ORDER BY rowid LIMIT ?"
 
-        self.cursor.execute(f"SELECT * FROM `{table_name}`")
-        data = self.cursor.fetchall()
+        def fetch_page(after_rowid, limit):
+            if after_rowid is None:
+                return self.cursor.execute(first_query, (limit,)).fetchall()
+            return self.cursor.execute(next_query, (after_rowid, limit)).fetchall()
 
-        return column_names, data
+        return column_names, column_types, fetch_page
+
+    def get_column_info(self, table_name):
+        """
+        Return the column names and declared types of a table, running PRAGMA table_info only the first
+        time it is seen.
+
+        Args:
+            table_name: The name of the table.
+
+        Returns:
+            tuple: The list of column names and the list of declared types, in table order.
+        """
+        info = self._col_cache.get(table_name)
+        if info is None:
+            self.cursor.execute(f"PRAGMA table_info(`{table_name}`)")
+            columns = self.cursor.fetchall()
+            info = ([col[1] for col in columns], [col[2] for col in columns])
+            self._col_cache[table_name] = info
+        return info
 
-    def add_table_tab(self, table_name, column_names, data):
+    def add_table_tab(self, table_name, column_names, fetch_page, column_types=None):
         """
         Add a new tab for a table.
 
         Args:
             table_name: The name of the table.
             column_names: List of column names for the table.
-            data: The data to display in the table.
+            fetch_page: Function fetch_page(after_rowid, limit) returning one page of the table's rows.
+            column_types: Optional list of declared column types, used to pick each column's cell converter.
         """
-        # Create a QTableWidget to display the table data
-        table_widget = QTableWidget()
-        table_widget.setRowCount(len(data))
-        table_widget.setColumnCount(len(column_names))
-        table_widget.setHorizontalHeaderLabels(column_names)
+        # Create a QTableView backed by a model over the raw rows; no per-cell items are created
+        model = SqlTableModel(column_names, parent=self, column_types=column_types,
+                              fetch_page=fetch_page, page_size=self.page_size)
+        table_view = QTableView()
+        table_view.setModel(model)
 
-        # Populate the table with data
-        for row_idx, row_data in enumerate(data):
-            for col_idx, col_data in enumerate(row_data):
-                table_widget.setItem(row_idx, col_idx, QTableWidgetItem(str(col_data)))
+        # Load the first page now; the view asks the model for further pages as the user scrolls
+        model.fetchMore()
 
-        # Add the table widget as a new tab
-        self.tab_widget.addTab(table_widget, table_name)
+        # Size the columns to their contents, measuring a sample of 50 rows rather than every row
+        table_view.horizontalHeader().setResizeContentsPrecision(50)
+        table_view.resizeColumnsToContents()
+
+        # Add the table view as a new tab
+        self.tab_widget.addTab(table_view, table_name)
 
     def closeEvent(self, event):
         """
         Ensure the database connection is closed when the application is closed.
         """
         self.cursor.close()
-        self.db_connection.close()
+        if self.owns_connection:
+            self.db_connection.execute("PRAGMA optimize")
+            self.db_connection.close()
         event.accept()
 
 # -----------------------
@@ -3870,6 +4251,73 @@ class CharacterDialog(QDialog):
 # -----------------------
 # Theme Customization Dialog
 # -----------------------
+
+# Customizable elements and their row labels, formatted once at import
+_THEME_UI_ELEMENTS = tuple(
+    (element, f"{element.replace('_', ' ').capitalize()}:")
+    for element in ('background', 'text_color', 'button_color')
+)
+_THEME_MINIMAP_ELEMENTS = tuple(
+    (element, f"{element.capitalize()}:")
+    for element in ('bank', 'tavern', 'transit', 'user_building', 'shop', 'guild', 'placesofinterest')
+)
+
+# Application stylesheets keyed by (background, text, button) color names, so switching back to a
+# previously used theme reuses the formatted sheet
+_STYLESHEET_CACHE = {}
+
+def _theme_stylesheet(background_color, text_color, button_color):
+    """
+    Return the application stylesheet for the given theme colors.
+
+    Args:
+        background_color (str): Background color name, e.g. '#d4d4d4'.
+        text_color (str): Text color name.
+        button_color (str): Button color name.
+
+    Returns:
+        str: The cached stylesheet.
+    """
+    key = (background_color, text_color, button_color)
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = f"""
+                QWidget {{
+                    background-color: {background_color};
+                    color: {text_color};
+                }}
+                QPushButton {{
+                    background-color: {button_color};
+                    color: {text_color};
+                }}
+                QLabel {{
+                    color: {text_color};
+                }}
+                """
+        _STYLESHEET_CACHE[key] = stylesheet
+    return stylesheet
+
+# 20x20 color swatches keyed by QColor.rgba(), shared so each distinct color is only rendered once
+_SWATCH_CACHE = {}
+
+def _swatch_pixmap(color):
+    """
+    Return the shared 20x20 swatch pixmap filled with the given color.
+
+    Args:
+        color (QColor): The color of the swatch.
+
+    Returns:
+        QPixmap: The cached swatch pixmap.
+    """
+    key = color.rgba()
+    pixmap = _SWATCH_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(20, 20)
+        pixmap.fill(color)
+        _SWATCH_CACHE[key] = pixmap
+    return pixmap
+
 class ThemeCustomizationDialog(QDialog):
     """
     Dialog for customizing the application's theme colors.
@@ -3893,6 +4341,9 @@ class ThemeCustomizationDialog(QDialog):
         # Initialize color mappings
         self.color_mappings = color_mappings if color_mappings else {}
 
+        # Elements whose color was changed in this dialog; only these are written back on Save
+        self.changed_elements = set()
+
         # Main layout of the dialog
         layout = QVBoxLayout(self)
 
@@ -3906,9 +4357,11 @@ class ThemeCustomizationDialog(QDialog):
         self.tabs.addTab(self.ui_tab, "UI, Buttons, and Text")
         self.tabs.addTab(self.minimap_tab, "Minimap Content")
 
-        # Set up the tabs with content
+        # Set up the tabs with content, repainting once when all rows are in place
+        self.setUpdatesEnabled(False)
         self.setup_ui_tab()
         self.setup_minimap_tab()
+        self.setUpdatesEnabled(True)
 
         # Add Save and Cancel buttons
         button_layout = QHBoxLayout()
@@ -3928,25 +4381,7 @@ class ThemeCustomizationDialog(QDialog):
 
         This tab allows users to customize colors for the background, text, and buttons.
         """
-        layout = QGridLayout(self.ui_tab)
-
-        # UI elements that can be customized
-        ui_elements = ['background', 'text_color', 'button_color']
-
-        # Create the layout with color squares and change buttons
-        for index, element in enumerate(ui_elements):
-            color_square = QLabel()
-            color_square.setFixedSize(20, 20)
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(self.color_mappings.get(element, QColor('white')))
-            color_square.setPixmap(pixmap)
-
-            color_button = QPushButton('Change Color')
-            color_button.clicked.connect(lambda _, el=element, sq=color_square: self.change_color(el, sq))
-
-            layout.addWidget(QLabel(f"{element.replace('_', ' ').capitalize()}:"), index, 0)
-            layout.addWidget(color_square, index, 1)
-            layout.addWidget(color_button, index, 2)
+        self.add_color_rows(QGridLayout(self.ui_tab), _THEME_UI_ELEMENTS)
 
     def setup_minimap_tab(self):
         """
@@ -3955,23 +4390,25 @@ class ThemeCustomizationDialog(QDialog):
         This tab allows users to customize colors for different elements on the minimap,
         such as banks, taverns, and user buildings.
         """
-        layout = QGridLayout(self.minimap_tab)
+        self.add_color_rows(QGridLayout(self.minimap_tab), _THEME_MINIMAP_ELEMENTS)
 
-        # Minimap elements that can be customized
-        minimap_elements = ['bank', 'tavern', 'transit', 'user_building', 'shop', 'guild', 'placesofinterest']
+    def add_color_rows(self, layout, elements):
+        """
+        Add a label, color square and change button row to the grid for each element.
 
-        # Create the layout with color squares and change buttons
-        for index, element in enumerate(minimap_elements):
+        Args:
+            layout (QGridLayout): The grid to fill.
+            elements (tuple): Pairs of (element name, row label).
+        """
+        for index, (element, label) in enumerate(elements):
             color_square = QLabel()
             color_square.setFixedSize(20, 20)
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(self.color_mappings.get(element, QColor('white')))
-            color_square.setPixmap(pixmap)
+            color_square.setPixmap(_swatch_pixmap(self.color_mappings.get(element, QColor('white'))))
 
             color_button = QPushButton('Change Color')
             color_button.clicked.connect(lambda _, el=element, sq=color_square: self.change_color(el, sq))
 
-            layout.addWidget(QLabel(f"{element.capitalize()}:"), index, 0)
+            layout.addWidget(QLabel(label), index, 0)
             layout.addWidget(color_square, index, 1)
             layout.addWidget(color_button, index, 2)
 
@@ -3983,12 +4420,16 @@ class ThemeCustomizationDialog(QDialog):
             element_name (str): The name of the element whose color is being changed.
             color_square (QLabel): The QLabel that shows the current color.
         """
-        color = QColorDialog.getColor()
-        if color.isValid():
-            self.color_mappings[element_name] = color
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(color)
-            color_square.setPixmap(pixmap)
+        current = self.color_mappings.get(element_name)
+        color = QColorDialog.getColor(current if current is not None else QColor('white'), self)
+
+        # Nothing to do when the dialog was cancelled or the same color was picked again
+        if not color.isValid() or (current is not None and color.rgba() == current.rgba()):
+            return
+
+        self.color_mappings[element_name] = color
+        self.changed_elements.add(element_name)
+        color_square.setPixmap(_swatch_pixmap(color))
 
     def apply_theme(self):
         """
@@ -3996,11 +4437,8 @@ class ThemeCustomizationDialog(QDialog):
 
         This method updates the application's stylesheet based on the selected colors.
         """
-        # Apply background color
+        # Apply background, text and button colors in a single stylesheet, so Qt parses and restyles once
         background_color = self.color_mappings.get('background', QColor('white'))
-        self.setStyleSheet(f"background-color: {background_color.name()};")
-
-        # Apply text and button colors
         text_color = self.color_mappings.get('text_color', QColor('black')).name()
         button_color = self.color_mappings.get('button_color', QColor('lightgrey')).name()
         self.setStyleSheet(
@@ -4012,109 +4450,165 @@ class ThemeCustomizationDialog(QDialog):
 # -----------------------
 # AVITD Scraper Class
 # -----------------------
+
+# Countdown shown in each next_change div, e.g. "2 days, 4h 10m 5s"
+_NEXT_UPDATE_RE = re.compile(r'(\d+)\s+days?,\s+(\d+)h\s+(\d+)m\s+(\d+)s')
+
+# Statements for each scraped table, written out once so every call binds the same SQL text and hits the
+# connection's statement cache. The keys double as the whitelist of tables update_database may write to.
+_SCRAPE_UPDATE_SQL = {
+    table: f"UPDATE {table} SET `Column`=?, `Row`=?, `next_update`=? WHERE `Name`=?"
+    for table in ("guilds", "shops")
+}
+_SCRAPE_RESET_SQL = {
+    table: f"UPDATE {table} SET `Column`='NA', `Row`='NA', `next_update`=? "
+           f"WHERE `Name` NOT IN (SELECT value FROM json_each(?))"
+    for table in ("guilds", "shops")
+}
+
 class AVITDScraper:
     """
     A scraper class for 'A View in the Dark' to update guilds and shops data in the SQLite database.
     """
 
+    # XPath queries compiled once; lxml evaluates them in C instead of walking a BeautifulSoup tree in Python.
+    # The section query returns the name and location cells of every odd/even row as one flat list,
+    # skipping rows with fewer than two cells.
+    _SECTION_CELLS_XPATH = etree.XPath(
+        '//img[@alt=$alt]/following::table[1]//tr['
+        'contains(concat(" ", normalize-space(@class), " "), " odd ") or '
+        'contains(concat(" ", normalize-space(@class), " "), " even ")]'
+        '[count(td) >= 2]/td[position() <= 2]'
+    )
+    _NEXT_CHANGE_XPATH = etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " next_change ")]')
+
     def __init__(self):
         """
         Initialize the scraper with the required headers and database connection.
         """
         self.url = "https://aviewinthedark.net/"
-        self.connection = sqlite3.connect(DB_PATH)  # SQLite connection
+        self.connection = _connect()  # SQLite connection
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate',
         }
 
+        # Keep-alive session so repeated scrapes reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.timeout = 10  # Seconds to wait for the site before giving up
+
         # Set up logging
         logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
         logging.info("AVITDScraper initialized.")
 
-    def scrape_guilds_and_shops(self):
+    def fetch_guilds_and_shops(self):
         """
-        Scrape the guilds and shops data from the website and update the SQLite database.
+        Download and parse the guilds and shops data without touching the database.
+
+        Called from a ScrapeTask worker thread. It only uses the HTTP session, which is not thread-safe,
+        so MainWindow.start_background_scrape never runs two tasks at once.
+
+        Returns:
+            tuple: (guilds, shops, guilds_next_update, shops_next_update).
         """
         logging.info("Starting to scrape guilds and shops.")
-        response = requests.get(self.url, headers=self.headers)
-        logging.debug(f"Received response: {response.status_code}")
+        response = self.session.get(self.url, timeout=self.timeout)
+        logging.debug("Received response: %s", response.status_code)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Hand lxml the raw bytes so the page is decoded once, by the C parser
+        parser = lxml.html.HTMLParser(encoding=response.encoding)
+        root = lxml.html.fromstring(response.content, parser=parser)
 
-        guilds = self.scrape_section(soup, "the guilds")
-        shops = self.scrape_section(soup, "the shops")
-        guilds_next_update = self.extract_next_update_time(soup, 'Guilds')
-        shops_next_update = self.extract_next_update_time(soup, 'Shops')
+        guilds = self.scrape_section(root, "the guilds")
+        shops = self.scrape_section(root, "the shops")
+        guilds_next_update = self.extract_next_update_time(root, 'Guilds')
+        shops_next_update = self.extract_next_update_time(root, 'Shops')
+        return guilds, shops, guilds_next_update, shops_next_update
+
+    def store_results(self, results):
+        """
+        Write the results of fetch_guilds_and_shops to the SQLite database. Must run on the thread that owns
+        the connection.
+
+        Args:
+            results (tuple): (guilds, shops, guilds_next_update, shops_next_update).
+        """
+        guilds, shops, guilds_next_update, shops_next_update = results
 
         # Display results in the console (for debugging purposes)
         self.display_results(guilds, shops, guilds_next_update, shops_next_update)
 
-        # Update the SQLite database with scraped data
-        self.update_database(guilds, "guilds", guilds_next_update)
-        self.update_database(shops, "shops", shops_next_update)
+        # Update the SQLite database with scraped data; both tables are committed together in one transaction.
+        # BEGIN IMMEDIATE takes the write lock up front instead of relying on sqlite3's implicit transaction
+        # boundaries, so the batch either commits as a whole or not at all.
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.update_database(guilds, "guilds", guilds_next_update)
+            self.update_database(shops, "shops", shops_next_update)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
         logging.info("Finished scraping and updating the database.")
 
-    def scrape_section(self, soup, section_image_alt):
+    def scrape_section(self, root, section_image_alt):
         """
         Scrape a specific section (guilds or shops) from the website.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
+            root (lxml.html.HtmlElement): Parsed HTML content.
             section_image_alt (str): The alt text of the section image to locate the section.
 
         Returns:
             list: A list of tuples containing the name, column, and row of each entry.
         """
-        logging.debug(f"Scraping section: {section_image_alt}")
+        logging.debug("Scraping section: %s", section_image_alt)
         data = []
-        section_image = soup.find('img', alt=section_image_alt)
-        if not section_image:
+        cells = self._SECTION_CELLS_XPATH(root, alt=section_image_alt)
+        if not cells:
             logging.warning(f"No data found for {section_image_alt}.")
             return data
 
-        table = section_image.find_next('table')
-        rows = table.find_all('tr', class_=['odd', 'even'])
-
-        for row in rows:
-            columns = row.find_all('td')
-            if len(columns) < 2:
-                logging.debug(f"Skipping row due to insufficient columns: {row}")
-                continue
-
-            name = columns[0].text.strip()
-            location = columns[1].text.strip().replace("SE of ", "").strip()
+        # Pair up the flat cell list as (name cell, location cell)
+        texts = iter([cell.text_content().strip() for cell in cells])
+        for name, location in zip(texts, texts):
+            location = location.replace("SE of ", "").strip()
 
             try:
                 column, row = location.split(" and ")
                 data.append((name, column, row))
-                logging.debug(f"Extracted data - Name: {name}, Column: {column}, Row: {row}")
+                logging.debug("Extracted data - Name: %s, Column: %s, Row: %s", name, column, row)
             except ValueError:
-                logging.warning(f"Location format unexpected for {name}: {location}")
+                logging.warning("Location format unexpected for %s: %s", name, location)
 
         logging.info(f"Scraped {len(data)} entries from {section_image_alt}.")
         return data
 
-    def extract_next_update_time(self, soup, section_name):
+    def extract_next_update_time(self, root, section_name):
         """
         Extract the next update time for a specific section (guilds or shops).
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
+            root (lxml.html.HtmlElement): Parsed HTML content.
             section_name (str): The name of the section (e.g., 'Guilds', 'Shops').
 
         Returns:
             str: The next update time in 'YYYY-MM-DD HH:MM:SS' format or 'NA' if not found.
         """
-        logging.debug(f"Extracting next update time for section: {section_name}")
+        logging.debug("Extracting next update time for section: %s", section_name)
 
         # Find all divs with the 'next_change' class
-        section_divs = soup.find_all('div', class_='next_change')
+        section_divs = self._NEXT_CHANGE_XPATH(root)
 
         # Iterate through the divs to find the matching section
         for div in section_divs:
-            if section_name in div.text:
+            # text_content() concatenates every descendant text node, so build it once per div; the cheap
+            # substring test rules out the other section's div before the regex runs
+            text = div.text_content()
+            if section_name in text:
                 # Search for the time pattern
-                match = re.search(r'(\d+)\s+days?,\s+(\d+)h\s+(\d+)m\s+(\d+)s', div.text)
+                match = _NEXT_UPDATE_RE.search(text)
                 if match:
                     # Parse time components
                     days = int(match.group(1))
@@ -4124,7 +4618,7 @@ class AVITDScraper:
 
                     # Calculate the next update time
                     next_update = datetime.now() + timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-                    logging.debug(f"Next update time for {section_name}: {next_update}")
+                    logging.debug("Next update time for %s: %s", section_name, next_update)
 
                     # Return the formatted date-time string
                     return next_update.strftime('%Y-%m-%d %H:%M:%S')
@@ -4148,16 +4642,18 @@ class AVITDScraper:
 
         logging.info("Guilds Data:")
         for guild in guilds:
-            logging.info(f"Name: {guild[0]}, Column: {guild[1]}, Row: {guild[2]}")
+            logging.info("Name: %s, Column: %s, Row: %s", *guild)
 
         logging.info("Shops Data:")
         for shop in shops:
-            logging.info(f"Name: {shop[0]}, Column: {shop[1]}, Row: {shop[2]}")
+            logging.info("Name: %s, Column: %s, Row: %s", *shop)
 
     def update_database(self, data, table, next_update):
         """
         Update the SQLite database with the scraped data.
 
+        The changes are left uncommitted; the caller commits them as part of its transaction.
+
         Args:
             data (list): List of tuples containing the name, column, and row of each entry.
             table (str): The table name ('guilds' or 'shops') to update.
@@ -4167,29 +4663,33 @@ class AVITDScraper:
             logging.error("Failed to connect to the database.")
             return
 
+        if table not in _SCRAPE_UPDATE_SQL:
+            logging.error("Refusing to update unknown table: %s", table)
+            return
+
         cursor = self.connection.cursor()
 
-        # Step 1: Set all entries' Row and Column to 'NA' initially
+        # Step 1: Update with the correct data from the scraped results, binding every row to one prepared statement
         try:
-            logging.debug(f"Setting all {table} entries' Row and Column to 'NA'.")
-            cursor.execute(f"UPDATE {table} SET `Column`='NA', `Row`='NA', `next_update`=?", (next_update,))
+            logging.debug("Updating %d %s entries, Next Update=%s", len(data), table, next_update)
+            cursor.executemany(
+                _SCRAPE_UPDATE_SQL[table],
+                [(column, row, next_update, name) for name, column, row in data]
+            )
         except sqlite3.Error as e:
-            logging.error(f"Failed to reset {table} entries to 'NA': {e}")
+            logging.error(f"Failed to update {table} entries: {e}")
             return
 
-        # Step 2: Update with the correct data from the scraped results
-        for name, column, row in data:
-            try:
-                logging.debug(
-                    f"Updating {table} entry: Name={name}, Column={column}, Row={row}, Next Update={next_update}")
-                cursor.execute(
-                    f"UPDATE {table} SET `Column`=?, `Row`=?, `next_update`=? WHERE `Name`=?",
-                    (column, row, next_update, name)
-                )
-            except sqlite3.Error as e:
-                logging.error(f"Failed to update {table} entry '{name}': {e}")
+        # Step 2: Set Row and Column to 'NA' only for the entries missing from the scrape, so each row is written once
+        try:
+            logging.debug("Setting unlisted %s entries' Row and Column to 'NA'.", table)
+            cursor.execute(
+                _SCRAPE_RESET_SQL[table],
+                (next_update, json.dumps([name for name, _, _ in data]))
+            )
+        except sqlite3.Error as e:
+            logging.error(f"Failed to reset {table} entries to 'NA': {e}")
 
-        self.connection.commit()
         cursor.close()
         logging.info(f"Database updated for {table}.")
 
@@ -4197,23 +4697,95 @@ class AVITDScraper:
         """
         Close the SQLite database connection.
         """
+        self.session.close()
         if self.connection:
+            self.connection.execute("PRAGMA optimize")
             self.connection.close()
             logging.info("Database connection closed.")
 
+class ScrapeSignals(QObject):
+    """
+    Signals emitted by ScrapeTask. QRunnable is not a QObject, so the signals live on this helper.
+    """
+    finished = pyqtSignal(object)  # The tuple returned by AVITDScraper.fetch_guilds_and_shops, or None on failure
+
+class ScrapeTask(QRunnable):
+    """
+    Runs the AVITD download and parse on a QThreadPool worker so the GUI stays responsive.
+
+    The results are handed back through ScrapeSignals, whose slots run on the GUI thread where the
+    database writes happen.
+    """
+
+    def __init__(self, scraper):
+        """
+        Args:
+            scraper (AVITDScraper): The scraper whose HTTP session is used for the download.
+        """
+        super().__init__()
+        self.scraper = scraper
+        self.signals = ScrapeSignals()
+
+    def run(self):
+        try:
+            results = self.scraper.fetch_guilds_and_shops()
+        except Exception as e:
+            # The map keeps the locations already in the database; the next scrape tries again
+            logging.error(f"Failed to scrape guilds and shops: {e}")
+            results = None
+        self.signals.finished.emit(results)
+
 # -----------------------
 # Set Destination Dialog
 # -----------------------
+
+# Building tables checked for a name at a recent destination, in priority order
+_BUILDING_TABLES = ("banks", "guilds", "placesofinterest", "shops", "taverns", "transits", "userbuildings")
+
+# Last ten destinations of a character, served by the idx_recent_char_ts index
+_SQL_RECENT_DESTINATIONS = (
+    "SELECT col, row FROM recent_destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 10"
+)
+
+# First building at each of a batch of (column name, row name) intersections, passed as one JSON array of pairs.
+# Buildings are matched in _BUILDING_TABLES order.
+_SQL_BUILDINGS_AT = f"""
+    WITH wanted(col_name, row_name) AS (
+        SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') FROM json_each(?)
+    ), buildings(priority, Name, col_name, row_name) AS (
+        {" UNION ALL ".join(
+            f"SELECT {priority}, Name, `Column`, `Row` FROM `{table}`"
+            for priority, table in enumerate(_BUILDING_TABLES)
+        )}
+    )
+    SELECT col_name, row_name,
+           (SELECT b.Name FROM buildings b
+            WHERE b.col_name = wanted.col_name AND b.row_name = wanted.row_name
+            ORDER BY b.priority LIMIT 1)
+    FROM wanted
+"""
+
 class set_destination_dialog(QDialog):
     """
     A dialog for setting a destination on the map.
     """
 
+    # Dropdowns with predefined coordinates, as (dialog dropdown attribute, parent coordinate dict attribute)
+    _DROPDOWN_SPEC = (
+        ("tavern_dropdown", "taverns_coordinates"),
+        ("transit_dropdown", "transits_coordinates"),
+        ("shop_dropdown", "shops_coordinates"),
+        ("guild_dropdown", "guilds_coordinates"),
+        ("poi_dropdown", "places_of_interest_coordinates"),
+        ("user_building_dropdown", "user_buildings_coordinates"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Set Destination")
         self.resize(200, 250)
         self.parent = parent  # Access to parent methods and properties
+        self._conn = parent._db  # Share the main window's long-lived, tuned connection; the parent closes it
         logging.info("Initialized set_destination_dialog")
 
         # Main layout setup
@@ -4244,7 +4816,7 @@ class set_destination_dialog(QDialog):
 
         # Populate dropdowns with values from the data sources
         self.populate_dropdown(self.tavern_dropdown, self.parent.taverns_coordinates.keys())
-        self.populate_dropdown(self.bank_dropdown, [f"{col} & {row}" for (col, row, _, _) in self.parent.banks_coordinates])
+        self.populate_dropdown(self.bank_dropdown, self.parent.banks_display)
         self.populate_dropdown(self.transit_dropdown, self.parent.transits_coordinates.keys())
         self.populate_dropdown(self.shop_dropdown, self.parent.shops_coordinates.keys())
         self.populate_dropdown(self.guild_dropdown, self.parent.guilds_coordinates.keys())
@@ -4310,19 +4882,16 @@ class set_destination_dialog(QDialog):
 
         character_id = self.parent.selected_character.get('id')
 
-        connection = sqlite3.connect(DB_PATH)
-        cursor = connection.cursor()
+        cursor = self._conn.cursor()
 
         try:
             # Fetch recent destinations for the character
-            cursor.execute(
-                "SELECT col, row FROM recent_destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 10",
-                (character_id,)
-            )
-            recent_destinations = cursor.fetchall()
+            recent_destinations = cursor.execute(_SQL_RECENT_DESTINATIONS, (character_id,)).fetchall()
             logging.info(f"Fetched {len(recent_destinations)} recent destinations for character {character_id}.")
 
-            # Process each recent destination
+            # Resolve street names from the parent's coordinate-indexed lists, which are rebuilt whenever
+            # the map data is reloaded, instead of querying the columns and rows tables
+            entries = []
             for col, row in recent_destinations:
                 try:
                     # Convert to integers if they aren't already
@@ -4337,29 +4906,24 @@ class set_destination_dialog(QDialog):
                 rounded_row = row if row in (0, 200) else (row if row % 2 != 0 else row - 1)
                 logging.debug("Rounded col=%d to %d and row=%d to %d", col, rounded_col, row, rounded_row)
 
-                # Fetch street names
-                cursor.execute("SELECT Name FROM `columns` WHERE Coordinate = ?", (rounded_col,))
-                col_name = cursor.fetchone()
-                col_name = col_name[0] if col_name else f"Column {rounded_col}"
-
-                cursor.execute("SELECT Name FROM `rows` WHERE Coordinate = ?", (rounded_row,))
-                row_name = cursor.fetchone()
-                row_name = row_name[0] if row_name else f"Row {rounded_row}"
-
-                # Check for a named building at this location across all relevant tables
-                building_name = None
-                for table in ["banks", "guilds", "placesofinterest", "shops", "taverns", "transits", "userbuildings"]:
-                    cursor.execute(
-                        f"SELECT Name FROM `{table}` WHERE `Column` = ? AND `Row` = ?",
-                        (col_name, row_name)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        building_name = result[0]
-                        break
-
-                # Format display name
-                display_name = f"{col_name} & {row_name}"
+                col_name = self.parent.street_name_at(self.parent._col_name_at, rounded_col)
+                row_name = self.parent.street_name_at(self.parent._row_name_at, rounded_row)
+                entries.append((col, row, rounded_col, rounded_row, col_name, row_name))
+
+            # Look up the buildings for every intersection with known street names in one query
+            intersections = [[col_name, row_name] for _, _, _, _, col_name, row_name in entries
+                             if col_name and row_name]
+            buildings = {}
+            if intersections:
+                for col_name, row_name, building_name in cursor.execute(
+                        _SQL_BUILDINGS_AT, (json.dumps(intersections),)):
+                    buildings[(col_name, row_name)] = building_name
+
+            for col, row, rounded_col, rounded_row, col_name, row_name in entries:
+                building_name = buildings.get((col_name, row_name))
+
+                # Format display name, falling back to the coordinates where no street name was found
+                display_name = f"{col_name or f'Column {rounded_col}'} & {row_name or f'Row {rounded_row}'}"
                 if building_name:
                     display_name += f" - {building_name}"
 
@@ -4367,47 +4931,44 @@ class set_destination_dialog(QDialog):
                 logging.info(f"Added recent destination: {display_name}")
         except sqlite3.Error as e:
             logging.error(f"Error fetching recent destinations: {e}")
-        finally:
-            connection.close()
 
     def populate_dropdown(self, dropdown, items):
         logging.info("Populating dropdown with %d items.", len(items))
-        dropdown.clear()
-        dropdown.addItem("Select a destination")
-        dropdown.addItems(items)
+        entries = ["Select a destination", *items]
+
+        # Swap the whole list in one model reset instead of inserting the items one row at a time
+        model = dropdown.model()
+        if isinstance(model, QStringListModel):
+            model.setStringList(entries)
+        else:
+            dropdown.setModel(QStringListModel(entries, dropdown))
+        dropdown.setCurrentIndex(0)
 
     def update_comboboxes(self):
         logging.info("Updating comboboxes.")
-        self.show_notification("Updating Shop and Guild Data. Please wait...")
 
-        # Run the scraper to update data if available
+        # Run the scraper in the background if available; the main window stores the results and redraws the
+        # map, then refresh_comboboxes repopulates the dropdowns. A scrape already running is reused.
         if hasattr(self.parent, 'AVITD_scraper') and self.parent.AVITD_scraper:
-            self.parent.AVITD_scraper.scrape_guilds_and_shops()
+            task = self.parent.start_background_scrape()
+            task.signals.finished.connect(self.refresh_comboboxes)
 
-        # Reload data from the SQLite database
-        try:
-            updated_data = load_data()
-            self.parent.columns, self.parent.rows, self.parent.banks_coordinates, \
-                self.parent.taverns_coordinates, self.parent.transits_coordinates, \
-                self.parent.user_buildings_coordinates, self.parent.color_mappings, \
-                self.parent.shops_coordinates, self.parent.guilds_coordinates, \
-                self.parent.places_of_interest_coordinates = updated_data
+        self.show_notification("Updating Shop and Guild Data. Please wait...")
 
+    def refresh_comboboxes(self, _results=None):
+        """
+        Repopulate the dropdowns from the main window's location data once a scrape has finished.
+        """
+        try:
             # Populate dropdowns with updated data
             self.populate_dropdown(self.tavern_dropdown, self.parent.taverns_coordinates.keys())
-            self.populate_dropdown(self.bank_dropdown,
-                                   [f"{col} & {row}" for (col, row, _, _) in self.parent.banks_coordinates])
+            self.populate_dropdown(self.bank_dropdown, self.parent.banks_display)
             self.populate_dropdown(self.transit_dropdown, self.parent.transits_coordinates.keys())
             self.populate_dropdown(self.shop_dropdown, self.parent.shops_coordinates.keys())
             self.populate_dropdown(self.guild_dropdown, self.parent.guilds_coordinates.keys())
             self.populate_dropdown(self.poi_dropdown, self.parent.places_of_interest_coordinates.keys())
             self.populate_dropdown(self.user_building_dropdown, self.parent.user_buildings_coordinates.keys())
 
-            # Call update_minimap to redraw the map with the new data
-            if hasattr(self.parent, 'update_minimap') and callable(self.parent.update_minimap):
-                logging.info("Updating minimap with new data.")
-                self.parent.update_minimap()
-
             logging.info("Comboboxes updated successfully.")
         except Exception as e:
             logging.error(f"Failed to update comboboxes: {e}")
@@ -4433,7 +4994,7 @@ class set_destination_dialog(QDialog):
             return
 
         character_id = self.parent.selected_character['id']
-        connection = sqlite3.connect(DB_PATH)
+        connection = self._conn
         cursor = connection.cursor()
         try:
             cursor.execute('DELETE FROM destinations WHERE character_id = ?', (character_id,))
@@ -4443,9 +5004,8 @@ class set_destination_dialog(QDialog):
             self.parent.destination = None
             self.parent.update_minimap()
         except sqlite3.Error as e:
+            connection.rollback()
             logging.error(f"Failed to clear destination for character {character_id}: {e}")
-        finally:
-            connection.close()
 
         self.accept()
 
@@ -4465,7 +5025,7 @@ class set_destination_dialog(QDialog):
             character_id = self.parent.selected_character['id']
             logging.info(f"Setting destination for character {character_id} to {destination_coords}")
 
-            connection = sqlite3.connect(DB_PATH)
+            connection = self._conn
             cursor = connection.cursor()
             try:
                 # First, check if the destination already exists in recent destinations
@@ -4482,34 +5042,21 @@ class set_destination_dialog(QDialog):
                         INSERT INTO recent_destinations (character_id, col, row, timestamp)
                         VALUES (?, ?, ?, datetime('now'))
                     ''', (character_id, destination_coords[0], destination_coords[1]))
-                    connection.commit()
                     logging.info(f"Added destination to recent destinations: {destination_coords}")
 
-                # Now, update or insert the destination as the current destination
-                cursor.execute("SELECT id FROM destinations WHERE character_id = ?", (character_id,))
-                existing_destination = cursor.fetchone()
-
-                if existing_destination:
-                    cursor.execute('''
-                        UPDATE destinations
-                        SET col = ?, row = ?, timestamp = datetime('now')
-                        WHERE character_id = ?
-                    ''', (destination_coords[0], destination_coords[1], character_id))
-                else:
-                    cursor.execute('''
-                        INSERT INTO destinations (character_id, col, row, timestamp)
-                        VALUES (?, ?, ?, datetime('now'))
-                    ''', (character_id, destination_coords[0], destination_coords[1]))
+                # Now, update or insert the destination as the current destination in a single upsert,
+                # which updates the character's existing row in place
+                cursor.execute(_SQL_SET_DESTINATION, (character_id, destination_coords[0], destination_coords[1]))
 
+                # The recent destination and the current destination are committed together in one transaction
                 connection.commit()
                 logging.info(f"Destination set successfully for character {character_id} at {destination_coords}.")
 
                 self.parent.destination = destination_coords
                 self.parent.update_minimap()
             except sqlite3.Error as e:
+                connection.rollback()
                 logging.error(f"Failed to set destination for character {character_id}: {e}")
-            finally:
-                connection.close()
 
             self.accept()
         else:
@@ -4527,21 +5074,11 @@ class set_destination_dialog(QDialog):
             logging.info(f"Selected recent destination: {recent_selection} with coordinates {coords}")
             return coords
 
-        # Dropdowns with predefined coordinates
-        selected_dropdowns = [
-            (self.tavern_dropdown, self.parent.taverns_coordinates),
-            (self.transit_dropdown, self.parent.transits_coordinates),
-            (self.shop_dropdown, self.parent.shops_coordinates),
-            (self.guild_dropdown, self.parent.guilds_coordinates),
-            (self.poi_dropdown, self.parent.places_of_interest_coordinates),
-            (self.user_building_dropdown, self.parent.user_buildings_coordinates)
-        ]
-
-        # Check each dropdown for a valid selection
-        for dropdown, data in selected_dropdowns:
-            selection = dropdown.currentText()
+        # Check each dropdown for a valid selection; the coordinate dict is only fetched for the selected one
+        for dropdown_attr, coords_attr in self._DROPDOWN_SPEC:
+            selection = getattr(self, dropdown_attr).currentText()
             if selection and selection != "Select a destination":
-                coords = data.get(selection)
+                coords = getattr(self.parent, coords_attr).get(selection)
                 logging.info(f"Selected destination: {selection} with coordinates {coords}")
                 return coords
 
@@ -4593,7 +5130,32 @@ class set_destination_dialog(QDialog):
 # -----------------------
 # Shopping list Tools
 # -----------------------
+
+# Charisma levels in dropdown order, mapped to their shop_items price column
+_CHARISMA_COLUMNS = {
+    "No Charisma": "base_price",
+    "Charisma 1": "charisma_level_1",
+    "Charisma 2": "charisma_level_2",
+    "Charisma 3": "charisma_level_3"
+}
+
 class ShoppingListTool(QMainWindow):
+    # Queries for each price column, built once at class creation
+    _SELECT_SQL = {
+        column: f"SELECT item_name, {column} FROM shop_items WHERE shop_name = ?"
+        for column in _CHARISMA_COLUMNS.values()
+    }
+
+    # Prices for a JSON array of item names, so one fixed statement covers a shopping list of any length
+    _PRICE_SQL = {
+        column: f"SELECT item_name, {column} FROM shop_items "
+                f"WHERE shop_name = ? AND item_name IN (SELECT value FROM json_each(?))"
+        for column in _CHARISMA_COLUMNS.values()
+    }
+
+    # Available items are listed as "<name> - <price> Coins"; one match recovers both fields
+    _ITEM_RE = re.compile(r"^(?P<name>.+) - (?P<price>\d+) Coins$")
+
     def __init__(self, character_name, DB_PATH):
         """
         Initialize the Shopping List Tool with SQLite database support.
@@ -4609,12 +5171,19 @@ class ShoppingListTool(QMainWindow):
         self.DB_PATH = DB_PATH  # Central SQLite DB path
 
         # Initialize SQLite connection
-        self.sqlite_connection = sqlite3.connect(self.DB_PATH)
+        self.sqlite_connection = _connect(self.DB_PATH)
         self.sqlite_cursor = self.sqlite_connection.cursor()
 
+        # The tool is bound to one character, so resolve its id once instead of on every coin lookup
+        row = self.sqlite_cursor.execute(_SQL_CHARACTER_ID_BY_NAME, (self.character_name,)).fetchone()
+        self._character_id = row[0] if row else None
+
         # Initialize shopping list total
         self.list_total = 0
 
+        # Shopping list entries keyed by item name: {"price": int, "qty": int, "widget": QListWidgetItem}
+        self._items = {}
+
         # Setting up UI
         self.setup_ui()
 
@@ -4622,15 +5191,23 @@ class ShoppingListTool(QMainWindow):
         self.populate_shop_dropdown()
 
     def setup_ui(self):
+        # Coalesce bursts of shop/charisma changes into a single load_items query
+        self._load_items_timer = QTimer(self)
+        self._load_items_timer.setSingleShot(True)
+        self._load_items_timer.setInterval(150)
+        self._load_items_timer.timeout.connect(self.load_items)
+        # The combos restart the timer through a lambda: connecting start directly would select the
+        # QTimer.start(int msec) overload and replace the interval with the combo index
+
         # Initialize UI elements
         self.shop_combobox = QComboBox(self)
         self.charisma_combobox = QComboBox(self)
-        self.charisma_combobox.currentIndexChanged.connect(self.load_items)
+        self.charisma_combobox.currentIndexChanged.connect(lambda _: self._load_items_timer.start())
         self.available_items_list = QListWidget(self)
         self.shopping_list = QListWidget(self)
 
         # Add options to charisma combobox
-        self.charisma_combobox.addItems(["No Charisma", "Charisma 1", "Charisma 2", "Charisma 3"])
+        self.charisma_combobox.addItems(list(_CHARISMA_COLUMNS))
 
         # Buttons
         self.add_item_button = QPushButton("Add Item", self)
@@ -4649,11 +5226,15 @@ class ShoppingListTool(QMainWindow):
         layout.addWidget(self.shopping_list)
         layout.addWidget(self.remove_item_button)
 
-        # Create a label to display the total of the shopping list, coins in pocket, and bank balance
-        self.total_label = QLabel(
-            f"List total: {self.list_total} Coins | Coins in Pocket: {self.coins_in_pocket()} | Bank: {self.coins_in_bank()}"
-        )
-        layout.addWidget(self.total_label)
+        # Labels for the shopping list total and the character's coins. The total changes with every edit of
+        # the list while the balances only change in game, so they are refreshed separately
+        self.total_label = QLabel(f"List total: {self.list_total} Coins")
+        self.coins_label = QLabel()
+        totals_layout = QHBoxLayout()
+        totals_layout.addWidget(self.total_label)
+        totals_layout.addWidget(self.coins_label)
+        layout.addLayout(totals_layout)
+        self.refresh_coins_label()
 
         central_widget = QWidget(self)
         central_widget.setLayout(layout)
@@ -4662,8 +5243,8 @@ class ShoppingListTool(QMainWindow):
         self.add_item_button.clicked.connect(self.add_item)
         self.remove_item_button.clicked.connect(self.remove_item)
 
-        # Load items when shop or charisma level changes
-        self.shop_combobox.currentIndexChanged.connect(self.load_items)
+        # Load items when shop or charisma level changes (restarting the timer drops superseded reloads)
+        self.shop_combobox.currentIndexChanged.connect(lambda _: self._load_items_timer.start())
         self.charisma_combobox.currentIndexChanged.connect(self.update_shopping_list_prices)
 
         # Load items initially
@@ -4675,64 +5256,71 @@ class ShoppingListTool(QMainWindow):
         """
         selected_item = self.available_items_list.currentItem()
         if selected_item:
-            item_text = selected_item.text()
-            item_name, item_price = item_text.split(" - ")
-            item_price = int(item_price.split(" Coins")[0])
+            match = self._ITEM_RE.match(selected_item.text())
+            item_name = match.group('name')
+            item_price = int(match.group('price'))
 
             # Prompt user for the quantity
             quantity, ok = QInputDialog.getInt(self, "Enter Quantity", f"How many {item_name} to add?", 1, 1)
             if ok:
-                # Check if the item is already in the shopping list
-                for i in range(self.shopping_list.count()):
-                    existing_item_text = self.shopping_list.item(i).text()
-                    existing_item_name = existing_item_text.split(" - ")[0]
-                    if existing_item_name == item_name:
-                        # Update the quantity if the item is already present
-                        existing_quantity = int(existing_item_text.split(" - ")[2].split("x")[0])
-                        self.shopping_list.item(i).setText(
-                            f"{item_name} - {item_price} Coins - {existing_quantity + quantity}x"
-                        )
-                        self.update_total()
-                        return
-
-                # If the item is not in the list, add it with the entered quantity
-                self.shopping_list.addItem(f"{item_name} - {item_price} Coins - {quantity}x")
+                entry = self._items.get(item_name)
+                if entry:
+                    # Update the quantity if the item is already present
+                    entry["price"] = item_price
+                    entry["qty"] += quantity
+                else:
+                    # If the item is not in the list, add it with the entered quantity
+                    widget = QListWidgetItem()
+                    widget.setData(Qt.UserRole, item_name)
+                    self.shopping_list.addItem(widget)
+                    self._items[item_name] = {"price": item_price, "qty": quantity, "widget": widget}
+                self._render_item(item_name)
                 self.update_total()
 
+    def _render_item(self, item_name):
+        """
+        Write an entry's display text from its tracked price and quantity. The text is output only and is
+        never parsed back.
+
+        Args:
+            item_name (str): Name of the shopping list entry to redraw.
+        """
+        entry = self._items[item_name]
+        entry["widget"].setText(f"{item_name} - {entry['price']} Coins - {entry['qty']}x")
+
     def remove_item(self):
         """
         Prompt for quantity to remove from the selected item in the shopping list.
         """
         selected_item = self.shopping_list.currentItem()
         if selected_item:
-            item_text = selected_item.text()
-            item_name, item_price, item_quantity = item_text.split(" - ")
-            item_price = int(item_price.split(" Coins")[0])
-            item_quantity = int(item_quantity.split("x")[0])
+            item_name = selected_item.data(Qt.UserRole)
+            entry = self._items[item_name]
 
             # Prompt the user for the quantity to remove
-            quantity_to_remove, ok = QInputDialog.getInt(self, "Enter Quantity", f"How many {item_name} to remove?", 1, 1, item_quantity)
+            quantity_to_remove, ok = QInputDialog.getInt(self, "Enter Quantity", f"How many {item_name} to remove?", 1, 1, entry["qty"])
             if ok:
-                new_quantity = item_quantity - quantity_to_remove
+                new_quantity = entry["qty"] - quantity_to_remove
                 if new_quantity > 0:
                     # Update the item's quantity in the list without re-adding "Coins"
-                    self.shopping_list.currentItem().setText(f"{item_name} - {item_price} Coins - {new_quantity}x")
+                    entry["qty"] = new_quantity
+                    self._render_item(item_name)
                 else:
                     # Remove the item if the quantity reaches zero
                     self.shopping_list.takeItem(self.shopping_list.row(selected_item))
+                    del self._items[item_name]
 
                 self.update_total()
 
     def populate_shop_dropdown(self):
         """
-        Populate the shop dropdown with available shops from the MySQL database.
+        Populate the shop dropdown with available shops from the SQLite database.
         """
         try:
             self.sqlite_cursor.execute("SELECT DISTINCT shop_name FROM shop_items")
             shops = self.sqlite_cursor.fetchall()
-            for shop in shops:
-                self.shop_combobox.addItem(shop[0])
-        except pymysql.MySQLError as err:
+            self.shop_combobox.addItems([shop for (shop,) in shops])
+        except sqlite3.Error as err:
             print(f"Error fetching shop names: {err}")
 
     def load_items(self):
@@ -4744,26 +5332,14 @@ class ShoppingListTool(QMainWindow):
         charisma_level = self.charisma_combobox.currentText()
 
         # Determine the price column based on charisma level
-        price_column = {
-            "No Charisma": "base_price",
-            "Charisma 1": "charisma_level_1",
-            "Charisma 2": "charisma_level_2",
-            "Charisma 3": "charisma_level_3"
-        }.get(charisma_level, "base_price")
-
-        # Load items for the selected shop and charisma level from MySQL
-        query = f"""
-        SELECT item_name, {price_column}
-        FROM shop_items
-        WHERE shop_name = ?
-        """
-        self.sqlite_cursor.execute(query, (shop_name,))
+        price_column = _CHARISMA_COLUMNS.get(charisma_level, "base_price")
+
+        # Load items for the selected shop and charisma level
+        self.sqlite_cursor.execute(self._SELECT_SQL[price_column], (shop_name,))
         items = self.sqlite_cursor.fetchall()
 
-        for item in items:
-            item_name = item[0]
-            price = item[1]
-            self.available_items_list.addItem(f"{item_name} - {price} Coins")
+        # Insert the whole list at once instead of one addItem() per row
+        self.available_items_list.addItems([f"{item_name} - {price} Coins" for item_name, price in items])
 
     def update_shopping_list_prices(self):
         """
@@ -4773,31 +5349,14 @@ class ShoppingListTool(QMainWindow):
         charisma_level = self.charisma_combobox.currentText()
 
         # Determine the price column based on charisma level
-        price_column = {
-            "No Charisma": "base_price",
-            "Charisma 1": "charisma_level_1",
-            "Charisma 2": "charisma_level_2",
-            "Charisma 3": "charisma_level_3"
-        }.get(charisma_level, "base_price")
-
-        # Update prices for each item in the shopping list
-        for i in range(self.shopping_list.count()):
-            item_text = self.shopping_list.item(i).text()
-            item_name = item_text.split(" - ")[0]
-            quantity = int(item_text.split(" - ")[2].split("x")[0])
-
-            # Query for the updated price from MySQL
-            query = f"""
-            SELECT {price_column}
-            FROM shop_items
-            WHERE item_name = ? AND shop_name = ?
-            """
-            self.sqlite_cursor.execute(query, (item_name, shop_name))
-            result = self.sqlite_cursor.fetchone()
+        price_column = _CHARISMA_COLUMNS.get(charisma_level, "base_price")
 
-            if result:
-                updated_price = result[0]
-                self.shopping_list.item(i).setText(f"{item_name} - {updated_price} Coins - {quantity}x")
+        # Fetch the prices for every item in the shopping list in one query, then update only the rows returned
+        if self._items:
+            self.sqlite_cursor.execute(self._PRICE_SQL[price_column], (shop_name, json.dumps(list(self._items))))
+            for item_name, price in self.sqlite_cursor.fetchall():
+                self._items[item_name]["price"] = price
+                self._render_item(item_name)
 
         self.update_total()
 
@@ -4805,45 +5364,41 @@ class ShoppingListTool(QMainWindow):
         """
         Update the total cost of the shopping list and display it.
         """
-        self.list_total = 0
-        for index in range(self.shopping_list.count()):
-            item_text = self.shopping_list.item(index).text()
-            item_price = int(item_text.split(" - ")[1].split(" Coins")[0])
-            item_quantity = int(item_text.split(" - ")[2].split("x")[0])
-            self.list_total += item_price * item_quantity
-
-        # Update the label with the correct total, considering the coins in pocket and bank
-        self.total_label.setText(
-            f"List total: {self.list_total} Coins | Coins in Pocket: {self.coins_in_pocket()} | Bank: {self.coins_in_bank()}"
-        )
+        # Sum straight from the tracked entries; the display text is never parsed back
+        self.list_total = sum(entry["price"] * entry["qty"] for entry in self._items.values())
 
-    def coins_in_pocket(self):
+        # Only the total is refreshed here; the coin balances have their own label
+        self.total_label.setText(f"List total: {self.list_total} Coins")
+
+    def refresh_coins_label(self):
         """
-        Retrieve the number of coins in the pocket for the given character from the SQLite DB.
+        Re-read the character's pocket and bank balances and display them.
         """
-        cursor = self.sqlite_connection.cursor()
-        cursor.execute("SELECT id FROM characters WHERE name = ?", (self.character_name,))
-        character_id = cursor.fetchone()
-
-        if character_id:
-            cursor.execute("SELECT pocket FROM coins WHERE character_id = ?", (character_id[0],))
-            result = cursor.fetchone()
-            return result[0] if result else 0
-        return 0
+        pocket, bank = self._fetch_coins()
+        self.coins_label.setText(f"| Coins in Pocket: {pocket} | Bank: {bank}")
 
-    def coins_in_bank(self):
+    def _fetch_coins(self):
         """
-        Retrieve the number of coins in the bank for the given character from the SQLite DB.
+        Retrieve the pocket and bank balances for the tool's character in a single query.
+
+        Returns:
+            tuple: (pocket, bank), or (0, 0) if the character has no coins record.
         """
-        cursor = self.sqlite_connection.cursor()
-        cursor.execute("SELECT id FROM characters WHERE name = ?", (self.character_name,))
-        character_id = cursor.fetchone()
+        if self._character_id is None:
+            return 0, 0
+        result = self.sqlite_connection.execute(
+            "SELECT pocket, bank FROM coins WHERE character_id = ?", (self._character_id,)
+        ).fetchone()
+        return result if result else (0, 0)
 
-        if character_id:
-            cursor.execute("SELECT bank FROM coins WHERE character_id = ?", (character_id[0],))
-            result = cursor.fetchone()
-            return result[0] if result else 0
-        return 0
+    def closeEvent(self, event):
+        """
+        Ensure the SQLite database connection is closed when the tool window is closed.
+        """
+        if self.sqlite_connection:
+            self.sqlite_connection.execute("PRAGMA optimize")
+            self.sqlite_connection.close()
+        event.accept()
 
 # -----------------------
 # Damage Calculator Tool
@@ -4872,7 +5427,7 @@ class DamageCalculator(QDialog):
         charisma_layout = QHBoxLayout()
         charisma_label = QLabel("Charisma Level:")
         self.charisma_dropdown = QComboBox()
-        self.charisma_dropdown.addItems(["No Charisma", "Charisma 1", "Charisma 2", "Charisma 3"])
+        self.charisma_dropdown.addItems(list(_CHARISMA_COLUMNS))
         self.charisma_dropdown.currentIndexChanged.connect(self.update_charisma_level)
         charisma_layout.addWidget(charisma_label)
         charisma_layout.addWidget(self.charisma_dropdown)
@@ -4935,23 +5490,22 @@ class DamageCalculator(QDialog):
         # Step 1: Calculate the number of Vial of Holy Water hits needed to reduce BP to <= 1350
         vial_hits = 0
         while remaining_bp > 1350:
-            damage = math.floor(remaining_bp * 0.6)  # Vial of Holy Water does BP * 0.6 damage
-            remaining_bp -= damage
+            # Vial of Holy Water does floor(BP * 0.6) damage, computed in integers as (BP * 3) // 5
+            remaining_bp -= (remaining_bp * 3) // 5
             vial_hits += 1
-            total_cost += vial_cost
-            total_hits += 1
+        total_cost += vial_hits * vial_cost
+        total_hits += vial_hits
 
         if vial_hits > 0:
             results.append(
                 f"Discount Magic - Vial of Holy Water - Qty: {vial_hits} - Total Cost: {vial_hits * vial_cost:,} coins")
 
-        # Step 2: Calculate the number of Garlic Spray hits needed to reduce BP to <= 200
-        spray_hits = 0
-        while remaining_bp > 200:
-            remaining_bp -= 75  # Garlic Spray does a fixed average of 75 damage
-            spray_hits += 1
-            total_cost += spray_cost
-            total_hits += 1
+        # Step 2: Calculate the number of Garlic Spray hits needed to reduce BP to <= 200.
+        # Garlic Spray does a fixed average of 75 damage, so the count is a ceiling division
+        spray_hits = max(0, -(-(remaining_bp - 200) // 75))
+        remaining_bp -= spray_hits * 75
+        total_cost += spray_hits * spray_cost
+        total_hits += spray_hits
 
         if spray_hits > 0:
             results.append(
@@ -4972,7 +5526,19 @@ class DamageCalculator(QDialog):
 # -----------------------
 # Powers Reference Tool
 # -----------------------
+
+# Fixed statement text, so each query is prepared once and then served from the connection's statement cache
+_SQL_LOAD_POWERS = "SELECT name FROM powers ORDER BY name COLLATE NOCASE ASC"
+_SQL_LOAD_POWER_DETAILS = """
+    SELECT name, guild, cost, quest_info, skill_info
+    FROM powers
+    WHERE name = ?
+"""
+
 class PowersDialog(QDialog):
+    # Power names shared by every dialog instance; the powers table is static reference data
+    _power_names = None
+
     def __init__(self,DB_PATH):
         """
         Initialize the PowersDialog with an SQLite connection using the global DB_PATH.
@@ -4982,7 +5548,7 @@ class PowersDialog(QDialog):
         self.setMinimumSize(600, 400)
 
         # Establish SQLite connection using the global DB_PATH
-        self.db_connection = sqlite3.connect(DB_PATH)
+        self.db_connection = _connect()
 
         # Layout setup
         main_layout = QHBoxLayout(self)
@@ -5029,14 +5595,17 @@ class PowersDialog(QDialog):
         Load all powers from the SQLite database and populate the list widget.
         """
         try:
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT power_id, name FROM powers ORDER BY name ASC")
-            powers = cursor.fetchall()
-            cursor.close()
-
-            # Populate the powers list
-            for power_id, name in powers:
-                self.powers_list.addItem(name)
+            # Query the table only the first time the dialog is opened
+            if PowersDialog._power_names is None:
+                cursor = self.db_connection.cursor()
+                cursor.execute(_SQL_LOAD_POWERS)
+                PowersDialog._power_names = [name for (name,) in cursor.fetchall()]
+                cursor.close()
+
+            # Populate the powers list in one batch insert rather than one item per call
+            self.powers_list.setUpdatesEnabled(False)
+            self.powers_list.addItems(PowersDialog._power_names)
+            self.powers_list.setUpdatesEnabled(True)
 
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to load powers from the database:\n{e}")
@@ -5053,13 +5622,7 @@ class PowersDialog(QDialog):
             cursor = self.db_connection.cursor()
 
             # Query for the power's details
-            cursor.execute(
-                """
-                SELECT name, guild, cost, quest_info, skill_info
-                FROM powers
-                WHERE name = ?
-                """, (power_name,)
-            )
+            cursor.execute(_SQL_LOAD_POWER_DETAILS, (power_name,))
             power_details = cursor.fetchone()
             cursor.close()
 
@@ -5082,6 +5645,7 @@ class PowersDialog(QDialog):
         Ensure the SQLite database connection is closed when the dialog is closed.
         """
         if self.db_connection:
+            self.db_connection.execute("PRAGMA optimize")
             self.db_connection.close()
         event.accept()
 